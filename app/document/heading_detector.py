@@ -3,11 +3,20 @@ Heading Detector
 Identifies section headings in documents to guide segmentation
 """
 import re
+from itertools import accumulate
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
 
+# Section type -> heading keywords (substring match), checked in order
+_SECTION_KEYWORDS = (
+    ('introduction', ('introduction', 'overview', 'background', 'preface', 'abstract')),
+    ('conclusion', ('conclusion', 'summary', 'final', 'closing', 'recap')),
+    ('methodology', ('method', 'approach', 'implementation', 'procedure', 'experiment')),
+)
+
+
 @dataclass
 class Heading:
     """Represents a document heading"""
@@ -22,6 +31,9 @@ class HeadingDetector:
     
     def __init__(self):
         """Initialize heading detector"""
+        # Compiled once: detect_headings() matches them against every line
+        self.numbered_pattern = re.compile(r'^((?:\d+\.)+)\s+(.+)$')
+        self.underline_pattern = re.compile(r'^[=\-]{3,}$')
         logger.info("HeadingDetector initialized")
     
     def detect_headings(self, text: str) -> List[Heading]:
@@ -44,6 +56,8 @@ class HeadingDetector:
         
         headings = []
         lines = text.split('\n')
+        # Character offset of each line start (running sum, not re-summed per line)
+        offsets = list(accumulate((len(l) + 1 for l in lines), initial=0))
         
         for i, line in enumerate(lines):
             line_stripped = line.strip()
@@ -60,14 +74,14 @@ class HeadingDetector:
                 headings.append(Heading(
                     text=line_stripped,
                     level=1,
-                    position=sum(len(l) + 1 for l in lines[:i]),
+                    position=offsets[i],
                     line_number=i
                 ))
                 logger.debug(f"Found ALL CAPS heading at line {i}: {line_stripped}")
                 continue
             
             # Pattern 2: Numbered headings (e.g., "1.", "1.1", "1.1.1")
-            numbered_match = re.match(r'^((?:\d+\.)+)\s+(.+)$', line_stripped)
+            numbered_match = self.numbered_pattern.match(line_stripped)
             if numbered_match:
                 level = numbered_match.group(1).count('.')
                 heading_text = numbered_match.group(2)
@@ -75,14 +89,14 @@ class HeadingDetector:
                 headings.append(Heading(
                     text=heading_text,
                     level=level,
-                    position=sum(len(l) + 1 for l in lines[:i]),
+                    position=offsets[i],
                     line_number=i
                 ))
                 logger.debug(f"Found numbered heading at line {i}: {heading_text} (level {level})")
                 continue
             
             # Pattern 3: Underlined headings
-            if i > 0 and re.match(r'^[=\-]{3,}$', line_stripped):
+            if i > 0 and self.underline_pattern.match(line_stripped):
                 prev_line = lines[i-1].strip()
                 if prev_line and len(prev_line.split()) <= 10:
                     level = 1 if '=' in line_stripped else 2
@@ -90,7 +104,7 @@ class HeadingDetector:
                     headings.append(Heading(
                         text=prev_line,
                         level=level,
-                        position=sum(len(l) + 1 for l in lines[:i-1]),
+                        position=offsets[i-1],
                         line_number=i-1
                     ))
                     logger.debug(f"Found underlined heading at line {i-1}: {prev_line} (level {level})")
@@ -167,6 +181,7 @@ class HeadingDetector:
         
         sections = []
         lines = text.split('\n')
+        offsets = list(accumulate((len(l) + 1 for l in lines), initial=0))
         
         for i, heading in enumerate(headings):
             # Determine section boundaries
@@ -188,7 +203,7 @@ class HeadingDetector:
                     'level': heading.level,
                     'section_type': self._classify_section(heading.text),
                     'start_pos': heading.position,
-                    'end_pos': sum(len(l) + 1 for l in lines[:end_line])
+                    'end_pos': offsets[end_line]
                 })
         
         logger.info(f"Split document into {len(sections)} sections")
@@ -207,23 +222,10 @@ class HeadingDetector:
         """
         heading_lower = heading_text.lower()
         
-        # Introduction keywords
-        if any(kw in heading_lower for kw in [
-            'introduction', 'overview', 'background', 'preface', 'abstract'
-        ]):
-            return 'introduction'
-        
-        # Conclusion keywords
-        if any(kw in heading_lower for kw in [
-            'conclusion', 'summary', 'final', 'closing', 'recap'
-        ]):
-            return 'conclusion'
-        
-        # Methodology keywords
-        if any(kw in heading_lower for kw in [
-            'method', 'approach', 'implementation', 'procedure', 'experiment'
-        ]):
-            return 'methodology'
+        for section_type, keywords in _SECTION_KEYWORDS:
+            for kw in keywords:
+                if kw in heading_lower:
+                    return section_type
         
         # Default to body
         return 'body'
@@ -11,7 +11,9 @@ from loguru import logger
 class DocumentLoader:
     """Loads documents from various file formats"""
     
-    SUPPORTED_EXTENSIONS = {'.txt', '.pdf'}
+    # Extension -> loader method name
+    _LOADERS = {'.txt': 'load_text', '.pdf': 'load_pdf'}
+    SUPPORTED_EXTENSIONS = set(_LOADERS)
     
     def __init__(self):
         """Initialize document loader"""
@@ -104,20 +106,16 @@ class DocumentLoader:
             raise FileNotFoundError(f"File not found: {filepath}")
         
         extension = path.suffix.lower()
+        loader_name = self._LOADERS.get(extension)
         
-        if extension not in self.SUPPORTED_EXTENSIONS:
+        if loader_name is None:
             logger.error(f"Unsupported file type: {extension}")
             raise ValueError(
                 f"Unsupported file type: {extension}. "
                 f"Supported types: {', '.join(self.SUPPORTED_EXTENSIONS)}"
             )
         
-        if extension == '.txt':
-            return self.load_text(filepath)
-        elif extension == '.pdf':
-            return self.load_pdf(filepath)
-        
-        raise ValueError(f"Unsupported file extension: {extension}")
+        return getattr(self, loader_name)(filepath)
     
     def validate_content(self, content: str, min_length: int = 100) -> bool:
         """
@@ -130,8 +128,17 @@ class DocumentLoader:
         Returns:
             True if content is valid
         """
-        if not content or len(content.strip()) < min_length:
-            logger.warning(f"Content too short: {len(content)} chars (min: {min_length})")
-            return False
+        n = len(content) if content else 0
+        if n and n >= min_length:
+            # Length of content.strip() without copying the whole document:
+            # only the leading/trailing whitespace runs are scanned
+            start, end = 0, n
+            while start < end and content[start].isspace():
+                start += 1
+            while end > start and content[end - 1].isspace():
+                end -= 1
+            if end - start >= min_length:
+                return True
         
-        return True
+        logger.warning(f"Content too short: {n} chars (min: {min_length})")
+        return False
@@ -2,7 +2,7 @@
 Document Processor Engine
 Main orchestrator for document processing pipeline
 """
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from loguru import logger
 
@@ -24,7 +24,10 @@ class DocumentProcessor:
     def __init__(
         self,
         embedding_model: str = 'all-MiniLM-L6-v2',
-        similarity_threshold: float = 0.75
+        similarity_threshold: float = 0.75,
+        embedding_cache_dir: Optional[str] = None,
+        mini_batch_size: int = 64,
+        load_model_in_background: bool = False
     ):
         """
         Initialize document processor.
@@ -32,6 +35,10 @@ class DocumentProcessor:
         Args:
             embedding_model: SentenceTransformer model name
             similarity_threshold: Minimum similarity for grouping paragraphs
+            embedding_cache_dir: Optional on-disk embedding cache directory
+            mini_batch_size: Batch size for embedding all paragraphs at once
+            load_model_in_background: Load the embedding model on a worker
+                thread; process_document waits for it only when embedding
         """
         logger.info("Initializing DocumentProcessor")
         
@@ -39,7 +46,10 @@ class DocumentProcessor:
         self.heading_detector = HeadingDetector()
         self.segmenter = SemanticSegmenter(
             model_name=embedding_model,
-            similarity_threshold=similarity_threshold
+            similarity_threshold=similarity_threshold,
+            cache_dir=embedding_cache_dir,
+            batch_size=mini_batch_size,
+            load_in_background=load_model_in_background
         )
         
         logger.info("DocumentProcessor initialized successfully")
@@ -47,7 +57,8 @@ class DocumentProcessor:
     def process_document(
         self,
         filepath: str,
-        validate_content: bool = True
+        validate_content: bool = True,
+        progress_callback: Optional[Callable[[str], None]] = None
     ) -> List[SemanticUnit]:
         """
         Process a document through the full pipeline.
@@ -55,6 +66,8 @@ class DocumentProcessor:
         Args:
             filepath: Path to document file
             validate_content: Whether to validate content length
+            progress_callback: Optional callable invoked with a short stage
+                description after each of the four pipeline stages
             
         Returns:
             List of semantic units
@@ -77,6 +90,8 @@ class DocumentProcessor:
             )
         
         logger.info(f"Document loaded: {len(text)} characters")
+        if progress_callback:
+            progress_callback("Document loaded")
         
         # Stage 2: Detect headings
         headings = self.heading_detector.detect_headings(text)
@@ -89,6 +104,8 @@ class DocumentProcessor:
                 )
         else:
             logger.info("No headings detected; continuing with single-section segmentation")
+        if progress_callback:
+            progress_callback("Headings detected")
         
         # Stage 3: Split into sections
         sections = self.heading_detector.split_by_headings(text, headings)
@@ -100,6 +117,8 @@ class DocumentProcessor:
             logger.info(
                 f"Section {idx}: title='{section_title[:120]}', type={section_type}, chars={section_chars}"
             )
+        if progress_callback:
+            progress_callback("Sections split")
         
         # Stage 4: Segment into semantic units
         semantic_units = self.segmenter.segment_document(text, sections)
@@ -116,6 +135,8 @@ class DocumentProcessor:
         for unit in semantic_units:
             unit.metadata['source_file'] = str(Path(filepath).name)
             unit.metadata['source_path'] = str(filepath)
+        if progress_callback:
+            progress_callback("Semantic units created")
         
         logger.info(f"Document processing complete: {filepath}")
         return semantic_units
@@ -138,12 +159,14 @@ class DocumentProcessor:
                 'sections': {}
             }
         
-        total_words = sum(unit.word_count for unit in semantic_units)
-        avg_cohesion = sum(unit.similarity_score for unit in semantic_units) / len(semantic_units)
-        
-        # Group by section
+        # Totals and per-section grouping in a single traversal
+        total_words = 0
+        total_cohesion = 0.0
         sections = {}
         for unit in semantic_units:
+            total_words += unit.word_count
+            total_cohesion += unit.similarity_score
+            
             section_type = unit.document_section
             if section_type not in sections:
                 sections[section_type] = {
@@ -161,7 +184,37 @@ class DocumentProcessor:
             'total_units': len(semantic_units),
             'total_words': total_words,
             'avg_words_per_unit': total_words / len(semantic_units),
-            'avg_cohesion': avg_cohesion,
+            'avg_cohesion': total_cohesion / len(semantic_units),
             'sections': sections,
             'source_file': semantic_units[0].metadata.get('source_file', 'unknown')
         }
+
+
+# Shared processors keyed by (model, threshold, cache dir); see get_document_processor
+_shared_processors: Dict[Tuple[str, float, Optional[str]], DocumentProcessor] = {}
+
+
+def get_document_processor(
+    embedding_model: str = 'all-MiniLM-L6-v2',
+    similarity_threshold: float = 0.75,
+    embedding_cache_dir: Optional[str] = None,
+    load_model_in_background: bool = False
+) -> DocumentProcessor:
+    """
+    Return a process-wide DocumentProcessor for the given settings.
+    
+    Scripts and demos that run in the same interpreter share one instance
+    (and one copy of the embedding model) instead of loading it again.
+    load_model_in_background only applies when the instance is first created.
+    """
+    key = (embedding_model, similarity_threshold, embedding_cache_dir)
+    processor = _shared_processors.get(key)
+    if processor is None:
+        processor = DocumentProcessor(
+            embedding_model=embedding_model,
+            similarity_threshold=similarity_threshold,
+            embedding_cache_dir=embedding_cache_dir,
+            load_model_in_background=load_model_in_background
+        )
+        _shared_processors[key] = processor
+    return processor
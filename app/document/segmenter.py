@@ -2,7 +2,14 @@
 Semantic Segmenter
 Groups paragraphs into coherent semantic units using embeddings
 """
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from sentence_transformers import SentenceTransformer
 import numpy as np
@@ -11,6 +18,11 @@ from loguru import logger
 from app.document.heading_detector import Heading
 
 
+# Default on-disk paragraph embedding cache, resolved against the repo root so
+# every script shares one cache whatever directory it is run from
+DEFAULT_EMBEDDING_CACHE_DIR = str(Path(__file__).resolve().parents[2] / ".emb_cache")
+
+
 @dataclass
 class SemanticUnit:
     """Represents a semantic unit (segment) of a document"""
@@ -24,6 +36,28 @@ class SemanticUnit:
     metadata: Dict[str, Any]         # Additional context
 
 
+_MODEL_LOAD_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _cached_sentence_model(model_name: str) -> SentenceTransformer:
+    logger.info("Loading embedding model (this may take a moment on first run)...")
+    model = SentenceTransformer(model_name)
+    logger.info("Embedding model loaded successfully")
+    return model
+
+
+def _load_sentence_model(model_name: str) -> SentenceTransformer:
+    """
+    Load a SentenceTransformer once per process; segmenters share it read-only.
+    
+    lru_cache alone lets concurrent first calls (background loads, threaded
+    API handlers) each build a model, so loads are serialised by a lock.
+    """
+    with _MODEL_LOAD_LOCK:
+        return _cached_sentence_model(model_name)
+
+
 class SemanticSegmenter:
     """Segments documents into semantic units"""
     
@@ -32,7 +66,10 @@ class SemanticSegmenter:
         model_name: str = 'all-MiniLM-L6-v2',
         similarity_threshold: float = 0.75,
         min_group_size: int = 2,
-        max_group_size: int = 5
+        max_group_size: int = 5,
+        cache_dir: Optional[str] = None,
+        batch_size: int = 64,
+        load_in_background: bool = False
     ):
         """
         Initialize semantic segmenter.
@@ -42,16 +79,51 @@ class SemanticSegmenter:
             similarity_threshold: Minimum similarity for grouping paragraphs
             min_group_size: Minimum paragraphs per group
             max_group_size: Maximum paragraphs per group
+            cache_dir: Optional directory for on-disk paragraph embeddings,
+                keyed by model name and SHA-256 of the text (disabled if None)
+            batch_size: Mini-batch size for the embedding model's encode call
+            load_in_background: Load the model on a worker thread so callers
+                can do other work meanwhile; the first use of ``model`` waits
+                for it (and re-raises any load error)
         """
         logger.info(f"Initializing SemanticSegmenter with model: {model_name}")
-        logger.info("Loading embedding model (this may take a moment on first run)...")
-        self.model = SentenceTransformer(model_name)
-        logger.info("Embedding model loaded successfully")
+        self._model: Optional[SentenceTransformer] = None
+        self._model_future: Optional[Future] = None
+        if load_in_background:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding-model")
+            self._model_future = executor.submit(self._load_model, model_name)
+            executor.shutdown(wait=False)
+        else:
+            self._model = self._load_model(model_name)
         self.similarity_threshold = similarity_threshold
         self.min_group_size = min_group_size
         self.max_group_size = max_group_size
+        self.batch_size = batch_size
+        self.model_name = model_name
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Embedding cache enabled: {self.cache_dir}")
         logger.info("SemanticSegmenter initialized")
     
+    @staticmethod
+    def _load_model(model_name: str) -> SentenceTransformer:
+        """Load the SentenceTransformer model (shared per model name)"""
+        return _load_sentence_model(model_name)
+    
+    @property
+    def model(self) -> SentenceTransformer:
+        """Embedding model (waits for a background load if one is pending)"""
+        if self._model is None:
+            self._model = self._model_future.result()
+            self._model_future = None
+        return self._model
+    
+    @model.setter
+    def model(self, value: SentenceTransformer):
+        self._model = value
+        self._model_future = None
+    
     def segment_document(
         self,
         text: str,
@@ -61,11 +133,10 @@ class SemanticSegmenter:
         Segment document into semantic units.
         
         Algorithm:
-        1. For each section (from headings)
-        2. Extract paragraphs
-        3. Compute embeddings
-        4. Group paragraphs by semantic similarity
-        5. Create semantic units with metadata
+        1. Extract paragraphs for every section (from headings)
+        2. Compute all paragraph embeddings in one batched call
+        3. For each section, group paragraphs by semantic similarity
+        4. Create semantic units with metadata
         
         Args:
             text: Full document text
@@ -77,11 +148,16 @@ class SemanticSegmenter:
         logger.debug("Starting document segmentation")
         units = []
         
+        # Extract paragraphs and embed the whole document in one batched call
+        section_paragraphs = [self._extract_paragraphs(section['text']) for section in sections]
+        all_paragraphs = [p for paragraphs in section_paragraphs for p in paragraphs]
+        all_embeddings = self._encode(all_paragraphs) if all_paragraphs else None
+        offset = 0
+        
         for section_id, section in enumerate(sections):
             logger.debug(f"Processing section {section_id}: {section.get('title', 'Untitled')}")
             
-            # Extract paragraphs
-            paragraphs = self._extract_paragraphs(section['text'])
+            paragraphs = section_paragraphs[section_id]
             
             if not paragraphs:
                 logger.warning(f"No paragraphs found in section {section_id}")
@@ -89,8 +165,8 @@ class SemanticSegmenter:
             
             logger.debug(f"Found {len(paragraphs)} paragraphs in section {section_id}")
             
-            # Compute embeddings
-            embeddings = self.model.encode(paragraphs, convert_to_numpy=True)
+            embeddings = all_embeddings[offset:offset + len(paragraphs)]
+            offset += len(paragraphs)
             
             # Group by similarity
             groups = self._group_by_similarity(paragraphs, embeddings)
@@ -128,6 +204,67 @@ class SemanticSegmenter:
         logger.info(f"Document segmented into {len(units)} semantic units")
         return units
     
+    def _encode(self, paragraphs: List[str]) -> np.ndarray:
+        """
+        Embed paragraphs, reusing cached vectors when a cache_dir is set.
+        
+        Only cache misses go through the model (in a single encode call).
+        
+        Args:
+            paragraphs: List of paragraph strings
+            
+        Returns:
+            Paragraph embeddings (numpy array)
+        """
+        if self.cache_dir is None:
+            return self.model.encode(paragraphs, batch_size=self.batch_size, convert_to_numpy=True)
+        
+        paths = [self._cache_path(p) for p in paragraphs]
+        vectors = [self._load_cached(path) for path in paths]
+        missing = [i for i, vec in enumerate(vectors) if vec is None]
+        
+        if missing:
+            fresh = self.model.encode(
+                [paragraphs[i] for i in missing],
+                batch_size=self.batch_size,
+                convert_to_numpy=True
+            )
+            for i, vec in zip(missing, fresh):
+                self._save_cached(paths[i], vec)
+                vectors[i] = vec
+        
+        logger.debug(f"Embedding cache: {len(paragraphs) - len(missing)} hits, {len(missing)} misses")
+        return np.stack(vectors)
+    
+    def _cache_path(self, text: str) -> Path:
+        """On-disk cache location for one paragraph embedding"""
+        key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        model_tag = self.model_name.replace('/', '_')
+        return self.cache_dir / f"{model_tag}_{key}.npy"
+    
+    @staticmethod
+    def _load_cached(path: Path) -> Optional[np.ndarray]:
+        """Cached embedding at path, or None if absent or unreadable"""
+        if not path.exists():
+            return None
+        try:
+            return np.load(path)
+        except (ValueError, OSError, EOFError) as e:
+            logger.warning(f"Ignoring unreadable embedding cache file {path.name}: {e}")
+            return None
+    
+    @staticmethod
+    def _save_cached(path: Path, vector: np.ndarray):
+        """Write an embedding atomically so readers never see a partial file"""
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.stem, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, vector)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    
     def _extract_paragraphs(self, text: str) -> List[str]:
         """
         Extract non-empty paragraphs from text.
@@ -259,14 +396,13 @@ class SemanticSegmenter:
         if len(embeddings) == 1:
             return 1.0
         
-        # Compute pairwise similarities
-        similarities = []
-        for i in range(len(embeddings)):
-            for j in range(i + 1, len(embeddings)):
-                sim = self._cosine_similarity(embeddings[i], embeddings[j])
-                similarities.append(sim)
+        # Pairwise similarities as one matmul of L2-normalized rows; zero
+        # vectors stay zero so their pairs score 0.0, as in _cosine_similarity
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        normalized = embeddings / np.where(norms == 0, 1.0, norms)
+        similarities = normalized @ normalized.T
         
-        cohesion = float(np.mean(similarities))
+        cohesion = float(np.mean(similarities[np.triu_indices(len(embeddings), k=1)]))
         return cohesion
     
     @staticmethod
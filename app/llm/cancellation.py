@@ -0,0 +1,39 @@
+"""
+Cooperative Cancellation for LLM Generation
+Lets an interrupt stop a bot response that is still being generated
+"""
+import threading
+
+
+class GenerationCancelled(Exception):
+    """Raised when generation is abandoned through its CancellationToken"""
+    pass
+
+
+class CancellationToken:
+    """
+    Thread-safe cancel flag shared by a generating request and the
+    interrupt handler.
+
+    Generation code checks the token around each LLM call and stops as soon
+    as it is set, so an interrupted response does not keep spending tokens.
+    """
+
+    __slots__ = ('_event',)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def set(self):
+        """Request cancellation"""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True once set() has been called"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Raise GenerationCancelled if cancellation was requested"""
+        if self._event.is_set():
+            raise GenerationCancelled("Generation cancelled")
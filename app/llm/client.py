@@ -9,6 +9,7 @@ import requests
 from loguru import logger
 
 from app.config import settings
+from app.llm.cancellation import CancellationToken
 
 
 class LLMProvider(ABC):
@@ -30,12 +31,13 @@ class HuggingFaceLLM(LLMProvider):
         self.api_key = api_key
         self.model = model
         self.api_url = f"https://api-inference.huggingface.co/models/{model}"
+        # Reused across calls: keeps the TLS connection alive between turns
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {api_key}"
         logger.info(f"Initialized Hugging Face LLM: {model}")
     
     def generate(self, prompt: str, temperature: float = 0.0, max_tokens: int = 500) -> str:
         """Generate text using Hugging Face Inference API"""
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        
         payload = {
             "inputs": prompt,
             "parameters": {
@@ -47,7 +49,7 @@ class HuggingFaceLLM(LLMProvider):
         }
         
         try:
-            response = requests.post(self.api_url, headers=headers, json=payload, timeout=30)
+            response = self.session.post(self.api_url, json=payload, timeout=30)
             response.raise_for_status()
             
             result = response.json()
@@ -75,6 +77,8 @@ class OllamaLLM(LLMProvider):
     def __init__(self, base_url: str, model: str):
         self.base_url = base_url.rstrip('/')
         self.model = model
+        # Reused across calls: keeps the connection alive between turns
+        self.session = requests.Session()
         logger.info(f"Initialized Ollama LLM: {model} at {base_url}")
     
     def generate(self, prompt: str, temperature: float = 0.0, max_tokens: int = 500) -> str:
@@ -92,7 +96,7 @@ class OllamaLLM(LLMProvider):
         }
         
         try:
-            response = requests.post(url, json=payload, timeout=120)
+            response = self.session.post(url, json=payload, timeout=120)
             response.raise_for_status()
             
             result = response.json()
@@ -240,7 +244,8 @@ class LLMClient:
         self,
         prompt: str,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        cancel_token: Optional[CancellationToken] = None
     ) -> str:
         """
         Generate text from prompt.
@@ -249,17 +254,30 @@ class LLMClient:
             prompt: Input prompt
             temperature: Sampling temperature (default from config)
             max_tokens: Maximum tokens to generate (default from config)
+            cancel_token: Optional token; once set, the request is skipped
+                or its result discarded
             
         Returns:
             Generated text
+            
+        Raises:
+            GenerationCancelled: If cancel_token was set
         """
         temp = temperature if temperature is not None else settings.llm_temperature
         tokens = max_tokens if max_tokens is not None else settings.llm_max_tokens
         
         logger.debug(f"Generating with temp={temp}, max_tokens={tokens}")
         
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        
         response = self.provider.generate(prompt, temperature=temp, max_tokens=tokens)
         
+        # Providers do not stream: an interrupt during the request can only
+        # discard the result, so callers don't post-process a stale answer
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        
         logger.debug(f"Generated {len(response)} characters")
         
         return response
@@ -269,7 +287,8 @@ class LLMClient:
         role_name: str,
         role_prompt: str,
         context: str,
-        user_input: Optional[str] = None
+        user_input: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None
     ) -> str:
         """
         Generate role-based response.
@@ -279,6 +298,7 @@ class LLMClient:
             role_prompt: Role-specific system prompt
             context: Document context
             user_input: Optional user question/input
+            cancel_token: Optional token to abandon the generation
             
         Returns:
             Role-based response
@@ -297,4 +317,4 @@ Context:
         
         logger.info(f"Generating response for role: {role_name}")
         
-        return self.generate(full_prompt)
+        return self.generate(full_prompt, cancel_token=cancel_token)
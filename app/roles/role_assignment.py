@@ -5,6 +5,7 @@ Formula: Score = α(structural) + β(lexical) + γ(topic)
 Where: α=0.4, β=0.3, γ=0.3
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 import re
 from loguru import logger
@@ -363,6 +364,41 @@ def _ratios_for_allowed(allowed: List[RoleType]) -> Dict[RoleType, float]:
     return {r: _BASE_TARGET_RATIOS.get(r, 0.0) / s for r in allowed}
 
 
+class _AssignmentTally:
+    """Per-role counts and confidence sums, accumulated as assignments are made"""
+    
+    __slots__ = ('role_counts', 'confidence_sums', 'total')
+    
+    def __init__(self):
+        self.role_counts = {role: 0 for role in RoleType}
+        self.confidence_sums = {role: 0.0 for role in RoleType}
+        self.total = 0
+    
+    def add(self, assignment: RoleAssignment):
+        self.role_counts[assignment.assigned_role] += 1
+        self.confidence_sums[assignment.assigned_role] += assignment.confidence
+        self.total += 1
+    
+    def statistics(self) -> Dict:
+        """Statistics dict as returned by RoleAssigner.get_statistics"""
+        if not self.total:
+            return {}
+        
+        total = self.total
+        return {
+            'total_assignments': total,
+            'role_counts': self.role_counts,
+            'role_percentages': {
+                role: count / total * 100 for role, count in self.role_counts.items()
+            },
+            'average_confidences': {
+                role: self.confidence_sums[role] / count if count else 0.0
+                for role, count in self.role_counts.items()
+            },
+            'overall_confidence': sum(self.confidence_sums.values()) / total
+        }
+
+
 class RoleAssigner:
     """
     Assigns roles to semantic units using deterministic scoring.
@@ -394,6 +430,16 @@ class RoleAssigner:
         Returns:
             List of role assignments
         """
+        return self._assign_roles(semantic_units, balance_roles, allowed_roles)
+    
+    def _assign_roles(
+        self,
+        semantic_units: List[SemanticUnit],
+        balance_roles: bool,
+        allowed_roles: Optional[List[RoleType]],
+        tally: Optional[_AssignmentTally] = None,
+    ) -> List[RoleAssignment]:
+        """Shared body of assign_roles; each assignment made is added to `tally` if given"""
         if not semantic_units:
             return []
         
@@ -421,10 +467,10 @@ class RoleAssigner:
         # Assign roles based on scores
         if balance_roles:
             assignments = self._assign_with_balancing(
-                semantic_units, all_scores, allowed, target_ratios
+                semantic_units, all_scores, allowed, target_ratios, tally
             )
         else:
-            assignments = self._assign_greedy(semantic_units, all_scores, allowed)
+            assignments = self._assign_greedy(semantic_units, all_scores, allowed, tally)
         
         logger.info(f"Assigned roles to {len(assignments)} semantic units")
         return assignments
@@ -452,6 +498,7 @@ class RoleAssigner:
         semantic_units: List[SemanticUnit],
         all_scores: Dict[str, Dict[RoleType, RoleScore]],
         allowed: List[RoleType],
+        tally: Optional[_AssignmentTally] = None,
     ) -> List[RoleAssignment]:
         """
         Greedy assignment: assign best-scoring role to each unit.
@@ -479,6 +526,8 @@ class RoleAssigner:
                 ),
             )
             assignments.append(assignment)
+            if tally is not None:
+                tally.add(assignment)
 
         return assignments
     
@@ -488,6 +537,7 @@ class RoleAssigner:
         all_scores: Dict[str, Dict[RoleType, RoleScore]],
         allowed: List[RoleType],
         target_ratios: Dict[RoleType, float],
+        tally: Optional[_AssignmentTally] = None,
     ) -> List[RoleAssignment]:
         """
         Balanced assignment: ensure reasonable distribution of roles.
@@ -495,6 +545,7 @@ class RoleAssigner:
         Args:
             semantic_units: List of units
             all_scores: Scores for all units and roles
+            tally: Optional tally updated with each assignment
             
         Returns:
             List of role assignments
@@ -530,6 +581,8 @@ class RoleAssigner:
             )
             assignments.append(assignment)
             role_counts[first_open_role] += 1
+            if tally is not None:
+                tally.add(assignment)
             assigned_unit_ids.add(first_unit.id)
             logger.info(
                 f"First unit (position 0) assigned to {first_open_role.value} "
@@ -590,12 +643,36 @@ class RoleAssigner:
             )
             assignments.append(assignment)
             role_counts[assigned_role] += 1
+            if tally is not None:
+                tally.add(assignment)
         
         # Log distribution
         logger.debug(f"Role distribution: {role_counts}")
         
         return assignments
     
+    def assign_roles_with_statistics(
+        self,
+        semantic_units: List[SemanticUnit],
+        balance_roles: bool = True,
+        allowed_roles: Optional[List[RoleType]] = None,
+    ) -> Tuple[List[RoleAssignment], Dict]:
+        """
+        Assign roles and compute their statistics in one call.
+        
+        Args:
+            semantic_units: List of semantic units from document
+            balance_roles: If True, balance role distribution across document
+            allowed_roles: Optional role pool, as in `assign_roles`
+            
+        Returns:
+            Tuple of (assignments, statistics) where statistics matches
+            `get_statistics(assignments)`, tallied while assigning
+        """
+        tally = _AssignmentTally()
+        assignments = self._assign_roles(semantic_units, balance_roles, allowed_roles, tally)
+        return assignments, tally.statistics()
+    
     def get_role_queue(
         self,
         assignments: List[RoleAssignment]
@@ -627,32 +704,13 @@ class RoleAssigner:
         Returns:
             Dictionary with statistics
         """
-        if not assignments:
-            return {}
-        
-        # Count roles
-        role_counts = {role: 0 for role in RoleType}
+        tally = _AssignmentTally()
         for assignment in assignments:
-            role_counts[assignment.assigned_role] += 1
-        
-        # Average confidence per role
-        role_confidences = {role: [] for role in RoleType}
-        for assignment in assignments:
-            role_confidences[assignment.assigned_role].append(assignment.confidence)
-        
-        avg_confidences = {
-            role: sum(scores) / len(scores) if scores else 0.0
-            for role, scores in role_confidences.items()
-        }
-        
-        # Overall statistics
-        total = len(assignments)
-        avg_confidence = sum(a.confidence for a in assignments) / total
-        
-        return {
-            'total_assignments': total,
-            'role_counts': role_counts,
-            'role_percentages': {role: count / total * 100 for role, count in role_counts.items()},
-            'average_confidences': avg_confidences,
-            'overall_confidence': avg_confidence
-        }
+            tally.add(assignment)
+        return tally.statistics()
+
+
+@lru_cache(maxsize=1)
+def get_role_assigner() -> RoleAssigner:
+    """Return a process-wide RoleAssigner (it holds no per-document state)"""
+    return RoleAssigner()
@@ -3,6 +3,7 @@ Role Templates Module
 Defines the 5 pedagogical roles with prompts and metadata
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional
 from enum import Enum
 from loguru import logger
@@ -17,6 +18,12 @@ class RoleType(Enum):
     MISCONCEPTION_SPOTTER = "Misconception-Spotter"
 
 
+@lru_cache(maxsize=64)
+def _render_format_rules(rules: str, name: str) -> str:
+    """Fill a format-rules template once per (template, persona name)"""
+    return rules.format(name=name)
+
+
 @dataclass
 class RoleTemplate:
     """
@@ -79,7 +86,7 @@ class RoleTemplate:
     @property
     def FORMAT_RULES(self) -> str:
         if self.is_debate:
-            return self._FORMAT_RULES_DEBATE.format(name=self.name)
+            return _render_format_rules(self._FORMAT_RULES_DEBATE, self.name)
         return self._FORMAT_RULES_STUDY
 
     def build_prompt(
@@ -347,6 +354,9 @@ class RoleTemplateLibrary:
         """Initialize role template library"""
         self._templates: Dict[RoleType, RoleTemplate] = {}
         self._initialize_templates()
+        # Templates are fixed after init, so keyword routing is memoized per
+        # lowercased text (user messages repeat: "ok", "got it", ...)
+        self._best_role_for_lowered = lru_cache(maxsize=512)(self._score_keywords)
         logger.info(f"RoleTemplateLibrary initialized with {len(self._templates)} roles")
     
     def _initialize_templates(self):
@@ -579,8 +589,10 @@ class RoleTemplateLibrary:
         Returns:
             Best matching RoleTemplate or None
         """
-        text_lower = text.lower()
-        
+        return self._best_role_for_lowered(text.lower())
+    
+    def _score_keywords(self, text_lower: str) -> Optional[RoleTemplate]:
+        """Uncached keyword scoring behind find_best_role_for_keywords"""
         # Score each role based on keyword matches
         scores = {}
         
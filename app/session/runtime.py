@@ -11,6 +11,7 @@ from loguru import logger
 
 from app.document.processor import DocumentProcessor
 from app.document.segmenter import SemanticUnit
+from app.llm.cancellation import CancellationToken, GenerationCancelled
 from app.llm.client import LLMClient
 from app.roles.debate_synthesis import build_debate_personas_from_llm, render_debate_persona_prompt
 from app.roles.role_assignment import RoleAssignment, RoleAssigner, RoleScore
@@ -307,8 +308,9 @@ class ConversationRuntime:
             f"🎤 OPENER on Unit 1 of {sm.context.total_units} (speakers: {speaker_line})"
         )
 
+        token = sm.start_bot_response()
         start_gen = time.perf_counter()
-        messages = self._generate_group_opener(session, assignment)
+        messages = self._generate_group_opener(session, assignment, token)
         gen_time = int((time.perf_counter() - start_gen) * 1000)
         logger.info(
             f"✅ OPENER GENERATED ({len(messages)} messages, {gen_time}ms total)"
@@ -319,9 +321,7 @@ class ConversationRuntime:
             if self._is_debate(session) and session.debate_personas
             else assignment.assigned_role.value
         )
-        sm.context.current_role = last_role
-        sm.transition(EventType.BOT_RESPONSE, {"type": "start"})
-        sm.finish_bot_response()
+        self._finish_bot_turn(sm, token, messages, last_role, "start")
         self._log_state(sm, "after_start_conversation")
         logger.info("=" * 80)
 
@@ -363,16 +363,16 @@ class ConversationRuntime:
             f"chime_in_candidates={[r.value for r in assignment.chime_in_roles]}"
         )
 
-        sm.start_bot_response()
+        token = sm.start_bot_response()
         start_gen = time.perf_counter()
-        messages = self._generate_group_reply(session, assignment, message)
+        messages = self._generate_group_reply(session, assignment, message, token)
         gen_time = int((time.perf_counter() - start_gen) * 1000)
         logger.info(
             f"✅ GROUP REPLY GENERATED ({len(messages)} messages, {gen_time}ms total)"
         )
 
         # Optional soft wrap-up nudge after N user turns on the same unit.
-        nudge = self._maybe_wrap_up(session, assignment)
+        nudge = None if token.is_cancelled else self._maybe_wrap_up(session, assignment, token)
         if nudge is not None:
             messages.append(nudge)
 
@@ -381,9 +381,7 @@ class ConversationRuntime:
             if self._is_debate(session) and session.debate_personas
             else assignment.assigned_role.value
         )
-        sm.context.current_role = last_role
-        sm.transition(EventType.BOT_RESPONSE, {"type": "user_message"})
-        sm.finish_bot_response()
+        self._finish_bot_turn(sm, token, messages, last_role, "user_message")
         self._log_state(sm, "after_user_message")
         logger.info("=" * 80)
 
@@ -443,18 +441,23 @@ class ConversationRuntime:
             f"(override={'yes' if override_template else 'no'})"
         )
 
-        sm.start_bot_response()
-        response = self._generate_response(
-            template,
-            current_assignment.semantic_unit.text,
-            user_input=message,
-            session=session,
-        )
-        sm.context.current_role = template.name
-        sm.transition(EventType.BOT_RESPONSE, {"type": "interruption"})
-        sm.finish_bot_response()
+        token = sm.start_bot_response()
         role_name = template.name
-        self._record_exchange(session, message, role_name, response)
+        try:
+            response = self._generate_response(
+                template,
+                current_assignment.semantic_unit.text,
+                user_input=message,
+                session=session,
+                cancel_token=token,
+            )
+        except GenerationCancelled:
+            response = ""
+            messages = []
+        else:
+            self._record_exchange(session, message, role_name, response)
+            messages = [{"role": role_name, "text": response}]
+        self._finish_bot_turn(sm, token, messages, role_name, "interruption")
         self._log_state(sm, "after_interruption_answer")
 
         return {
@@ -462,7 +465,7 @@ class ConversationRuntime:
             "role": role_name,
             "interrupted_unit": result["interrupted_unit"],
             "response": response,
-            "messages": [{"role": role_name, "text": response}],
+            "messages": messages,
             "can_resume": True,
             "state": sm.get_state_summary(),
         }
@@ -496,21 +499,26 @@ class ConversationRuntime:
             return result
 
         assignment = self._current_assignment(session)
-        sm.start_bot_response()
+        token = sm.start_bot_response()
 
         if from_start:
-            messages = self._generate_group_opener(session, assignment)
+            messages = self._generate_group_opener(session, assignment, token)
         else:
-            response = self._generate_response(
-                assignment.role_template, assignment.semantic_unit.text, session=session
-            )
-            self._record_exchange(session, None, assignment.assigned_role.value, response)
-            messages = [{"role": assignment.role_template.name, "text": response}]
+            try:
+                response = self._generate_response(
+                    assignment.role_template,
+                    assignment.semantic_unit.text,
+                    session=session,
+                    cancel_token=token,
+                )
+            except GenerationCancelled:
+                messages = []
+            else:
+                self._record_exchange(session, None, assignment.assigned_role.value, response)
+                messages = [{"role": assignment.role_template.name, "text": response}]
 
         last_role = messages[-1]["role"] if messages else assignment.assigned_role.value
-        sm.context.current_role = last_role
-        sm.transition(EventType.BOT_RESPONSE, {"type": "resume"})
-        sm.finish_bot_response()
+        self._finish_bot_turn(sm, token, messages, last_role, "resume")
         self._log_state(sm, "after_resume")
 
         return {
@@ -567,16 +575,14 @@ class ConversationRuntime:
             f"Advanced to unit={assignment.semantic_unit.id} "
             f"(index={sm.context.current_unit_index}) with speakers={spk}"
         )
-        sm.start_bot_response()
-        messages = self._generate_group_opener(session, assignment)
+        token = sm.start_bot_response()
+        messages = self._generate_group_opener(session, assignment, token)
         last_role = messages[-1]["role"] if messages else (
             session.debate_personas[0].name
             if self._is_debate(session) and session.debate_personas
             else assignment.assigned_role.value
         )
-        sm.context.current_role = last_role
-        sm.transition(EventType.BOT_RESPONSE, {"type": "next_unit"})
-        sm.finish_bot_response()
+        self._finish_bot_turn(sm, token, messages, last_role, "next_unit")
         self._log_state(sm, "after_advance")
 
         payload["response"] = messages[-1]["text"] if messages else ""
@@ -658,6 +664,27 @@ class ConversationRuntime:
             f"last_bot_role={bot_role}, last_bot_chars={len(bot_msg)}"
         )
 
+    def _finish_bot_turn(
+        self,
+        sm: ConversationStateMachine,
+        cancel_token: CancellationToken,
+        messages: List[Dict[str, str]],
+        last_role: str,
+        response_type: str,
+    ):
+        """Record a finished bot turn on the state machine.
+
+        A turn whose cancel_token fired before any message was produced only
+        hands the input back; it is not counted as a bot response.
+        """
+        if not messages and cancel_token.is_cancelled:
+            logger.info(f"Bot turn ({response_type}) cancelled before any output")
+            sm.bot_response(message_count_delta=0)
+            return
+        sm.context.current_role = last_role
+        sm.transition(EventType.BOT_RESPONSE, {"type": response_type})
+        sm.finish_bot_response()
+
     def _log_state(self, sm: ConversationStateMachine, stage: str):
         """Log compact, consistent state snapshots for terminal observability."""
         summary = sm.get_state_summary()
@@ -687,6 +714,7 @@ class ConversationRuntime:
         self,
         session: ActiveConversation,
         assignment: RoleAssignment,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> List[Dict[str, str]]:
         """Produce a topic-opening multi-role exchange.
 
@@ -695,7 +723,7 @@ class ConversationRuntime:
         the unit's primary role; the rest are the pre-computed chime-ins.
         """
         if self._is_debate(session) and session.debate_personas:
-            return self._generate_debate_group_opener(session, assignment)
+            return self._generate_debate_group_opener(session, assignment, cancel_token)
 
         speakers = assignment.speaker_order()[: self.OPENER_SPEAKERS]
         other_names_full = [role_library.get_role(r).name for r in speakers]
@@ -714,14 +742,18 @@ class ConversationRuntime:
                 style = "chime_closer"
             else:
                 style = "chime"
-            text = self._generate_response_with_style(
-                template,
-                assignment.semantic_unit.text,
-                session=session,
-                reply_style=style,
-                group_transcript=list(messages),
-                other_role_names=other_names,
-            )
+            try:
+                text = self._generate_response_with_style(
+                    template,
+                    assignment.semantic_unit.text,
+                    session=session,
+                    reply_style=style,
+                    group_transcript=list(messages),
+                    other_role_names=other_names,
+                    cancel_token=cancel_token,
+                )
+            except GenerationCancelled:
+                break
             messages.append({"role": template.name, "text": text})
             self._record_exchange(session, None, template.name, text)
 
@@ -731,6 +763,7 @@ class ConversationRuntime:
         self,
         session: ActiveConversation,
         assignment: RoleAssignment,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> List[Dict[str, str]]:
         """Two-voice topic opener for perspective-debate mode."""
         personas = session.debate_personas or []
@@ -747,14 +780,18 @@ class ConversationRuntime:
                 style = "chime_closer"
             else:
                 style = "chime"
-            text = self._generate_response_with_style(
-                template,
-                assignment.semantic_unit.text,
-                session=session,
-                reply_style=style,
-                group_transcript=list(messages),
-                other_role_names=other_names,
-            )
+            try:
+                text = self._generate_response_with_style(
+                    template,
+                    assignment.semantic_unit.text,
+                    session=session,
+                    reply_style=style,
+                    group_transcript=list(messages),
+                    other_role_names=other_names,
+                    cancel_token=cancel_token,
+                )
+            except GenerationCancelled:
+                break
             messages.append({"role": template.name, "text": text})
             self._record_exchange(session, None, template.name, text)
         return messages
@@ -764,6 +801,7 @@ class ConversationRuntime:
         session: ActiveConversation,
         assignment: RoleAssignment,
         user_message: str,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> List[Dict[str, str]]:
         """Two-voice reply: best keyword match, then the other debater chimes in."""
         personas = session.debate_personas or []
@@ -777,27 +815,35 @@ class ConversationRuntime:
         )
         other_names_for_primary = [p.name for p in personas if p.name != primary_template.name]
         messages: List[Dict[str, str]] = []
-        primary_text = self._generate_response_with_style(
-            primary_template,
-            assignment.semantic_unit.text,
-            user_input=user_message,
-            session=session,
-            reply_style="reply",
-            other_role_names=other_names_for_primary,
-        )
-        messages.append({"role": primary_template.name, "text": primary_text})
-        self._record_exchange(session, user_message, primary_template.name, primary_text)
-        if self.REPLY_CHIME_IN:
-            other_names_for_chime = [p.name for p in personas if p.name != chime_template.name]
-            chime_text = self._generate_response_with_style(
-                chime_template,
+        try:
+            primary_text = self._generate_response_with_style(
+                primary_template,
                 assignment.semantic_unit.text,
                 user_input=user_message,
                 session=session,
-                reply_style="reply_chime",
-                group_transcript=list(messages),
-                other_role_names=other_names_for_chime,
+                reply_style="reply",
+                other_role_names=other_names_for_primary,
+                cancel_token=cancel_token,
             )
+        except GenerationCancelled:
+            return messages
+        messages.append({"role": primary_template.name, "text": primary_text})
+        self._record_exchange(session, user_message, primary_template.name, primary_text)
+        if self.REPLY_CHIME_IN:
+            other_names_for_chime = [p.name for p in personas if p.name != chime_template.name]
+            try:
+                chime_text = self._generate_response_with_style(
+                    chime_template,
+                    assignment.semantic_unit.text,
+                    user_input=user_message,
+                    session=session,
+                    reply_style="reply_chime",
+                    group_transcript=list(messages),
+                    other_role_names=other_names_for_chime,
+                    cancel_token=cancel_token,
+                )
+            except GenerationCancelled:
+                return messages
             messages.append({"role": chime_template.name, "text": chime_text})
             self._record_exchange(session, None, chime_template.name, chime_text)
         return messages
@@ -807,10 +853,13 @@ class ConversationRuntime:
         session: ActiveConversation,
         assignment: RoleAssignment,
         user_message: str,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> List[Dict[str, str]]:
         """Produce a primary reply + (optional) chime-in to the student."""
         if self._is_debate(session) and session.debate_personas:
-            return self._generate_debate_group_reply(session, assignment, user_message)
+            return self._generate_debate_group_reply(
+                session, assignment, user_message, cancel_token
+            )
 
         speakers = assignment.speaker_order()
         if not speakers:
@@ -846,14 +895,18 @@ class ConversationRuntime:
 
         messages: List[Dict[str, str]] = []
 
-        primary_text = self._generate_response_with_style(
-            primary_template,
-            assignment.semantic_unit.text,
-            user_input=user_message,
-            session=session,
-            reply_style="reply",
-            other_role_names=other_names_for_primary,
-        )
+        try:
+            primary_text = self._generate_response_with_style(
+                primary_template,
+                assignment.semantic_unit.text,
+                user_input=user_message,
+                session=session,
+                reply_style="reply",
+                other_role_names=other_names_for_primary,
+                cancel_token=cancel_token,
+            )
+        except GenerationCancelled:
+            return messages
         messages.append({"role": primary_template.name, "text": primary_text})
         self._record_exchange(session, user_message, primary_template.name, primary_text)
 
@@ -862,15 +915,19 @@ class ConversationRuntime:
             other_names_for_chime = [
                 role_library.get_role(r).name for r in speakers if r != chime_role
             ]
-            chime_text = self._generate_response_with_style(
-                chime_template,
-                assignment.semantic_unit.text,
-                user_input=user_message,
-                session=session,
-                reply_style="reply_chime",
-                group_transcript=list(messages),
-                other_role_names=other_names_for_chime,
-            )
+            try:
+                chime_text = self._generate_response_with_style(
+                    chime_template,
+                    assignment.semantic_unit.text,
+                    user_input=user_message,
+                    session=session,
+                    reply_style="reply_chime",
+                    group_transcript=list(messages),
+                    other_role_names=other_names_for_chime,
+                    cancel_token=cancel_token,
+                )
+            except GenerationCancelled:
+                return messages
             messages.append({"role": chime_template.name, "text": chime_text})
             # record WITHOUT user_input (already recorded once on primary)
             self._record_exchange(session, None, chime_template.name, chime_text)
@@ -881,6 +938,7 @@ class ConversationRuntime:
         self,
         session: ActiveConversation,
         assignment: RoleAssignment,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> Optional[Dict[str, str]]:
         """Return a soft wrap-up line if this unit has hit the nudge threshold.
 
@@ -896,12 +954,16 @@ class ConversationRuntime:
             template = session.debate_personas[0]
         else:
             template = role_library.get_role(assignment.assigned_role)
-        text = self._generate_response_with_style(
-            template,
-            assignment.semantic_unit.text,
-            session=session,
-            reply_style="wrap",
-        )
+        try:
+            text = self._generate_response_with_style(
+                template,
+                assignment.semantic_unit.text,
+                session=session,
+                reply_style="wrap",
+                cancel_token=cancel_token,
+            )
+        except GenerationCancelled:
+            return None
         self._record_exchange(session, None, template.name, text)
         return {"role": template.name, "text": text, "is_nudge": True}
 
@@ -915,11 +977,13 @@ class ConversationRuntime:
         reply_style: str = "auto",
         group_transcript: Optional[List[Dict[str, str]]] = None,
         other_role_names: Optional[List[str]] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Generate one role's turn.
 
         Uses the reply-style aware prompt so the same code path supports topic
         openers, chime-ins, primary replies, reply chime-ins, and wrap-up nudges.
+        Raises GenerationCancelled once cancel_token is set.
         """
         short_context = context[:1200]
         last_period = short_context.rfind(".")
@@ -936,6 +1000,8 @@ class ConversationRuntime:
             other_role_names=other_role_names,
         )
 
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         client = self._get_llm_client()
         if client is None:
             logger.warning(f"LLM unavailable; using fallback response for role {template.name}")
@@ -958,6 +1024,7 @@ class ConversationRuntime:
                 prompt,
                 temperature=template.temperature,
                 max_tokens=template.max_tokens,
+                cancel_token=cancel_token,
             ).strip()
             result = self._postprocess_response(
                 raw, template=template, other_role_names=other_role_names
@@ -970,6 +1037,9 @@ class ConversationRuntime:
             )
             self._llm_fail_count = 0  # reset on success
             return result
+        except GenerationCancelled:
+            logger.info(f"Generation of {template.name} response cancelled by interrupt")
+            raise
         except Exception as exc:
             self._llm_fail_count += 1
             logger.warning(
@@ -990,6 +1060,7 @@ class ConversationRuntime:
         context: str,
         user_input: Optional[str] = None,
         session: Optional[ActiveConversation] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> str:
         """Single-turn generator used by interruption and resume paths.
 
@@ -1008,6 +1079,7 @@ class ConversationRuntime:
             session=session,
             reply_style="auto",
             other_role_names=other_role_names,
+            cancel_token=cancel_token,
         )
 
     # Roles the LLM might hallucinate a turn for after its own. We cut the
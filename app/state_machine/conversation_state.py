@@ -2,12 +2,16 @@
 Conversation State Machine
 Clean, frontend-friendly interruption system
 """
+import pickle
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping
 from datetime import datetime
+from types import MappingProxyType
 from loguru import logger
 
+from app.llm.cancellation import CancellationToken
+
 
 class ConversationState(Enum):
     """Conversation states"""
@@ -17,6 +21,10 @@ class ConversationState(Enum):
     INTERRUPTED = "interrupted"
     PAUSED = "paused"
     COMPLETED = "completed"
+    
+    # Members are singletons: hash by identity in C instead of Enum's
+    # Python-level hash(self._name_) on every TRANSITIONS/set lookup
+    __hash__ = object.__hash__
 
 
 class EventType(Enum):
@@ -41,6 +49,16 @@ class EventType(Enum):
     UNPAUSE = "unpause"
     COMPLETE = "complete"
     RESET = "reset"
+    
+    # See ConversationState.__hash__
+    __hash__ = object.__hash__
+
+
+# Value -> member lookup used when deserializing (skips EnumMeta.__call__)
+_STATE_VALUE_MAP: Dict[str, ConversationState] = {s.value: s for s in ConversationState}
+
+# Shared read-only metadata for transitions recorded without any
+_EMPTY_META: Mapping[str, Any] = MappingProxyType({})
 
 
 @dataclass
@@ -50,12 +68,18 @@ class StateTransition:
     to_state: ConversationState
     event: EventType
     timestamp: datetime = field(default_factory=datetime.now)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+    
+    def __getstate__(self):
+        # _EMPTY_META (a mappingproxy) is not picklable
+        state = self.__dict__.copy()
+        state['metadata'] = dict(self.metadata)
+        return state
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationContext:
-    """All conversation state data"""
+    """All conversation state data (slotted: compact layout, fast attribute access)"""
     # State
     current_state: ConversationState = ConversationState.IDLE
     
@@ -101,8 +125,12 @@ class ConversationContext:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConversationContext':
         """Deserialize from dict"""
+        state_value = data['current_state']
+        current_state = _STATE_VALUE_MAP.get(state_value)
+        if current_state is None:
+            raise ValueError(f"{state_value!r} is not a valid ConversationState")
         ctx = cls(
-            current_state=ConversationState(data['current_state']),
+            current_state=current_state,
             current_unit_index=data['current_unit_index'],
             total_units=data['total_units'],
             current_role=data.get('current_role'),
@@ -161,9 +189,31 @@ class ConversationStateMachine:
         (ConversationState.COMPLETED, EventType.RESET): ConversationState.IDLE,
     }
     
+    # High-frequency events not recorded in state_history: message_count and
+    # current_unit_index cover them, and their metadata (the BOT_RESPONSE type
+    # label, NEXT_UNIT's from/to units) is not kept. USER_MESSAGE stays
+    # recorded because its metadata is the only copy of the user's text.
+    _UNRECORDED_EVENTS = frozenset({
+        EventType.BOT_RESPONSE,
+        EventType.NEXT_UNIT,
+    })
+    
+    # Setup path replayed by fast_init_engaged(): (from_state, event, to_state)
+    _SETUP_PATH = (
+        (ConversationState.IDLE, EventType.INITIALIZE, ConversationState.IDLE),
+        (ConversationState.IDLE, EventType.DOCUMENT_LOADED, ConversationState.READY),
+        (ConversationState.READY, EventType.ROLES_ASSIGNED, ConversationState.READY),
+        (ConversationState.READY, EventType.START_DIALOGUE, ConversationState.ENGAGED),
+    )
+    
     def __init__(self, session_id: Optional[str] = None):
         """Initialize state machine"""
         self.context = ConversationContext(session_id=session_id)
+        # get_state_summary() cache, keyed on the fields it reports
+        self._summary_key: Optional[tuple] = None
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        # Cancels the in-flight bot response; replaced by start_bot_response()
+        self.cancel_token = CancellationToken()
         logger.info(f"State machine initialized (session: {session_id})")
     
     def can_transition(self, event: EventType) -> bool:
@@ -184,25 +234,25 @@ class ConversationStateMachine:
         Raises:
             ValueError: If transition invalid
         """
-        if not self.can_transition(event):
+        old_state = self.context.current_state
+        new_state = self.TRANSITIONS.get((old_state, event))
+        if new_state is None:
             valid_events = [e.value for (s, e) in self.TRANSITIONS.keys() 
-                          if s == self.context.current_state]
+                          if s is old_state]
             raise ValueError(
-                f"Invalid transition: {self.context.current_state.value} + {event.value}. "
+                f"Invalid transition: {old_state.value} + {event.value}. "
                 f"Valid events: {valid_events}"
             )
         
-        old_state = self.context.current_state
-        new_state = self.TRANSITIONS[(old_state, event)]
-        
         # Record transition
-        transition = StateTransition(
-            from_state=old_state,
-            to_state=new_state,
-            event=event,
-            metadata=metadata or {}
-        )
-        self.context.state_history.append(transition)
+        if event not in self._UNRECORDED_EVENTS:
+            transition = StateTransition(
+                from_state=old_state,
+                to_state=new_state,
+                event=event,
+                metadata=metadata or _EMPTY_META
+            )
+            self.context.state_history.append(transition)
         
         # Update state
         self.context.current_state = new_state
@@ -211,7 +261,50 @@ class ConversationStateMachine:
         # Handle state-specific logic
         self._handle_state_entry(new_state, event, metadata)
         
-        logger.debug(f"Transition: {old_state.value} → {new_state.value} ({event.value})")
+        # Positional args: loguru formats only if DEBUG is enabled
+        logger.debug("Transition: {} → {} ({})", old_state.value, new_state.value, event.value)
+        return True
+    
+    def fast_init_engaged(self, total_units: int) -> bool:
+        """
+        Go from IDLE straight to ENGAGED with a document of `total_units`.
+        
+        Equivalent to INITIALIZE → DOCUMENT_LOADED → ROLES_ASSIGNED →
+        START_DIALOGUE with total_units set after loading (same history
+        records, with empty metadata, and entry effects), applied in one step.
+        
+        Args:
+            total_units: Number of semantic units in the document
+            
+        Returns:
+            True if successful
+            
+        Raises:
+            ValueError: If not in IDLE state
+        """
+        if self.context.current_state is not ConversationState.IDLE:
+            raise ValueError(
+                f"Invalid transition: {self.context.current_state.value} + fast_init_engaged. "
+                f"Requires state: {ConversationState.IDLE.value}"
+            )
+        
+        ctx = self.context
+        for from_state, event, to_state in self._SETUP_PATH:
+            ctx.state_history.append(StateTransition(
+                from_state=from_state,
+                to_state=to_state,
+                event=event,
+                metadata=_EMPTY_META
+            ))
+        
+        now = datetime.now()
+        ctx.total_units = total_units
+        ctx.current_unit_index = 0
+        ctx.started_at = now
+        ctx.last_activity = now
+        ctx.current_state = ConversationState.ENGAGED
+        
+        logger.debug("Transition: idle → engaged (fast init, {} units)", total_units)
         return True
     
     def _handle_state_entry(
@@ -221,36 +314,42 @@ class ConversationStateMachine:
         metadata: Optional[Dict[str, Any]]
     ):
         """Execute logic when entering a state"""
-        if state == ConversationState.ENGAGED and event == EventType.START_DIALOGUE:
+        if state is ConversationState.ENGAGED and event is EventType.START_DIALOGUE:
             self.context.started_at = datetime.now()
             self.context.current_unit_index = 0
         
-        elif state == ConversationState.INTERRUPTED:
+        elif state is ConversationState.INTERRUPTED:
             # Only record interruption on USER_INTERRUPT event, not on every entry
             # (bot can respond during INTERRUPTED state via BOT_RESPONSE event)
-            if event == EventType.USER_INTERRUPT:
+            if event is EventType.USER_INTERRUPT:
                 self.context.interrupted_at_index = self.context.current_unit_index
                 self.context.interruption_count += 1
                 logger.info(f"Interrupt #{self.context.interruption_count} at unit {self.context.current_unit_index}")
         
-        elif state == ConversationState.ENGAGED and event == EventType.RESUME:
+        elif state is ConversationState.ENGAGED and event is EventType.RESUME:
             logger.info(f"Resumed at unit {self.context.current_unit_index}")
         
-        elif state == ConversationState.COMPLETED:
+        elif state is ConversationState.COMPLETED:
             logger.info("Conversation completed")
     
     # =========================================================================
     # FRONTEND API - Methods called by UI
     # =========================================================================
     
-    def start_bot_response(self):
+    def start_bot_response(self) -> CancellationToken:
         """
         Bot starts generating response.
         Frontend: Show "Bot is typing..." indicator
+        
+        Returns:
+            Fresh cancellation token for this response; user_clicks_interrupt()
+            sets it
         """
+        self.cancel_token = CancellationToken()
         self.context.bot_is_generating = True
         self.context.awaiting_user_input = False
         logger.debug("Bot started generating")
+        return self.cancel_token
     
     def finish_bot_response(self):
         """
@@ -262,6 +361,22 @@ class ConversationStateMachine:
         self.context.message_count += 1
         logger.debug("Bot finished, awaiting user")
     
+    def bot_response(self, message_count_delta: int = 1):
+        """
+        Record a complete (non-streamed) bot response in one update.
+        
+        Fast path for synchronous responses: equivalent to
+        start_bot_response() + finish_bot_response() without the
+        intermediate "typing" state. Streaming callers keep the two-call API.
+        
+        Args:
+            message_count_delta: Messages produced by this response
+        """
+        self.context.bot_is_generating = False
+        self.context.awaiting_user_input = True
+        self.context.message_count += message_count_delta
+        logger.debug("Bot responded, awaiting user")
+    
     def user_clicks_interrupt(self) -> Dict[str, Any]:
         """
         User clicks [INTERRUPT] button.
@@ -279,7 +394,7 @@ class ConversationStateMachine:
                 'message': str
             }
         """
-        if self.context.current_state != ConversationState.ENGAGED:
+        if self.context.current_state is not ConversationState.ENGAGED:
             return {
                 'success': False,
                 'message': f'Cannot interrupt - state is {self.context.current_state.value}'
@@ -288,6 +403,7 @@ class ConversationStateMachine:
         interrupted_unit = self.context.current_unit_index
         
         # Stop bot immediately
+        self.cancel_token.set()
         self.context.bot_is_generating = False
         self.context.awaiting_user_input = True
         
@@ -318,7 +434,7 @@ class ConversationStateMachine:
                 'should_generate_response': bool
             }
         """
-        if self.context.current_state != ConversationState.INTERRUPTED:
+        if self.context.current_state is not ConversationState.INTERRUPTED:
             return {
                 'error': f'Not in interrupted state (current: {self.context.current_state.value})'
             }
@@ -344,7 +460,7 @@ class ConversationStateMachine:
                 'resuming_from_unit': int
             }
         """
-        if self.context.current_state != ConversationState.INTERRUPTED:
+        if self.context.current_state is not ConversationState.INTERRUPTED:
             return {
                 'success': False,
                 'message': f'Not interrupted (current: {self.context.current_state.value})'
@@ -374,13 +490,13 @@ class ConversationStateMachine:
                 'current_unit': int
             }
         """
-        if self.context.current_state != ConversationState.ENGAGED:
+        if self.context.current_state is not ConversationState.ENGAGED:
             return {
                 'error': f'Cannot process message in state {self.context.current_state.value}'
             }
         
         self.transition(EventType.USER_MESSAGE, {'message': message})
-        logger.debug(f"User message received")
+        logger.debug("User message received")
         
         return {
             'current_unit': self.context.current_unit_index
@@ -397,7 +513,7 @@ class ConversationStateMachine:
                 'completed': bool
             }
         """
-        if self.context.current_state != ConversationState.ENGAGED:
+        if self.context.current_state is not ConversationState.ENGAGED:
             return {
                 'success': False,
                 'message': f'Cannot advance in state {self.context.current_state.value}'
@@ -431,27 +547,56 @@ class ConversationStateMachine:
         """
         Get current state for UI rendering.
         
+        The summary is cached and rebuilt only when one of the fields it
+        reports has changed, so steady-state UI polling is cheap. Each call
+        returns its own copy, so callers may modify the result.
+        
         Returns:
             Complete state info for frontend
         """
+        ctx = self.context
+        key = (
+            ctx.current_state,
+            ctx.bot_is_generating,
+            ctx.awaiting_user_input,
+            ctx.current_unit_index,
+            ctx.total_units,
+            ctx.current_role,
+            ctx.interruption_count,
+            ctx.message_count,
+        )
+        if key != self._summary_key:
+            self._summary_key = key
+            self._summary_cache = self._build_state_summary()
+        
+        cached = self._summary_cache
+        return {
+            **cached,
+            'bot_status': dict(cached['bot_status']),
+            'progress': dict(cached['progress']),
+        }
+    
+    def _build_state_summary(self) -> Dict[str, Any]:
+        """Build the get_state_summary() dict from the current context"""
+        ctx = self.context
         return {
-            'current_state': self.context.current_state.value,
+            'current_state': ctx.current_state.value,
             'bot_status': {
-                'is_generating': self.context.bot_is_generating,
-                'awaiting_input': self.context.awaiting_user_input,
+                'is_generating': ctx.bot_is_generating,
+                'awaiting_input': ctx.awaiting_user_input,
             },
             'progress': {
-                'current_unit': self.context.current_unit_index,
-                'total_units': self.context.total_units,
-                'percentage': (self.context.current_unit_index / self.context.total_units * 100) 
-                             if self.context.total_units > 0 else 0
+                'current_unit': ctx.current_unit_index,
+                'total_units': ctx.total_units,
+                'percentage': (ctx.current_unit_index / ctx.total_units * 100) 
+                             if ctx.total_units > 0 else 0
             },
-            'current_role': self.context.current_role,
-            'interruptions': self.context.interruption_count,
-            'messages': self.context.message_count,
-            'can_interrupt': self.context.current_state == ConversationState.ENGAGED,
-            'can_resume': self.context.current_state == ConversationState.INTERRUPTED,
-            'is_complete': self.context.current_state == ConversationState.COMPLETED,
+            'current_role': ctx.current_role,
+            'interruptions': ctx.interruption_count,
+            'messages': ctx.message_count,
+            'can_interrupt': ctx.current_state is ConversationState.ENGAGED,
+            'can_resume': ctx.current_state is ConversationState.INTERRUPTED,
+            'is_complete': ctx.current_state is ConversationState.COMPLETED,
         }
     
     # =========================================================================
@@ -467,8 +612,27 @@ class ConversationStateMachine:
         self.context = ConversationContext.from_dict(state_data)
         logger.info(f"State loaded for session {self.context.session_id}")
     
+    def save_state_bytes(self) -> bytes:
+        """
+        Save state as a pickled blob for in-process caches.
+        
+        Much cheaper than dict -> JSON and keeps the full context
+        (including state history). Use save_state() for anything that
+        crosses a process or language boundary.
+        """
+        return pickle.dumps(self.context, protocol=5)
+    
+    def load_state_bytes(self, data: bytes):
+        """
+        Load state from save_state_bytes() output.
+        
+        Only pass trusted, self-produced bytes - unpickling runs arbitrary code.
+        """
+        self.context = pickle.loads(data)
+        logger.info(f"State loaded for session {self.context.session_id}")
+    
     def reset(self):
         """Reset to initial state"""
-        if self.context.current_state != ConversationState.IDLE:
+        if self.context.current_state is not ConversationState.IDLE:
             self.transition(EventType.RESET)
         logger.info("State machine reset")
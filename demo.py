@@ -4,34 +4,26 @@ Showcases the complete pipeline with beautiful visual output
 Perfect for screenshots and project presentations!
 """
 
+import argparse
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress
-from rich.text import Text
-from rich.layout import Layout
-from rich.live import Live
 from rich import box
-from rich.markdown import Markdown
-import time
-from pathlib import Path
-
-# Import our modules
-from app.document.processor import DocumentProcessor
-from app.roles.role_assignment import RoleAssigner
-from app.roles.role_templates import RoleType, role_library
+
+# Import our modules. DocumentProcessor and RoleAssigner pull in
+# sentence-transformers/torch, so they are imported where first used to let
+# the header render immediately.
+from app.roles.role_templates import RoleType
 from app.state_machine.conversation_state import (
     ConversationStateMachine,
-    EventType,
-    ConversationState
+    EventType
 )
 
 console = Console()
 
-
-def print_header():
-    """Print fancy header"""
-    header = """
+HEADER_BANNER = """
     ╔═══════════════════════════════════════════════════════════════╗
     ║                                                               ║
     ║   RQSM-ENGINE: Role-Queue State Machine                      ║
@@ -42,274 +34,254 @@ def print_header():
     ║                                                               ║
     ╚═══════════════════════════════════════════════════════════════╝
     """
-    console.print(header, style="bold cyan")
-    console.print()
 
+# Flattens line breaks and tabs in single-line text previews
+_NL_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
 
-def demo_stage_1_document_processing():
-    """Stage 1: Document Processing Pipeline"""
-    console.print("\n" + "="*70, style="bold yellow")
-    console.print(Panel.fit(
-        "[bold green]STAGE 1: DOCUMENT PROCESSING PIPELINE[/bold green]",
-        border_style="green"
-    ))
+# Stage 3 conversation script: (state machine method, args, event, state,
+# unit, description). The first row is the START_DIALOGUE already applied.
+FLOW_SCRIPT = [
+    (None, (), "START_DIALOGUE", "ENGAGED", 0, "Bot explains first concept"),
+    ("start_bot_response", (), "BOT_RESPONSE", "ENGAGED", 0, "Bot is generating response..."),
+    ("finish_bot_response", (), "BOT_RESPONSE", "ENGAGED", 0, "Bot finished, awaiting user"),
+    ("advance_unit", (), "NEXT_UNIT", "ENGAGED", 1, "Moving to next concept"),
+    ("start_bot_response", (), "BOT_RESPONSE", "ENGAGED", 1, "Bot explaining unit 1..."),
+    ("user_clicks_interrupt", (), "[bold red]USER_INTERRUPT[/bold red]",
+     "[bold red]INTERRUPTED[/bold red]", 1, "[bold]User clicks [INTERRUPT] button![/bold]"),
+    ("process_interruption_message", ("Wait, I don't understand X",),
+     "USER_MESSAGE", "INTERRUPTED", 1, "User: 'I don't understand X'"),
+    ("start_bot_response", (), "BOT_RESPONSE", "INTERRUPTED", 1, "Bot clarifying user's question"),
+    ("finish_bot_response", (), "BOT_RESPONSE", "INTERRUPTED", 1, "Clarification complete"),
+    ("resume_conversation", (), "[bold green]RESUME[/bold green]",
+     "[bold green]ENGAGED[/bold green]", 1, "[bold]Resumed from where we left off[/bold]"),
+    ("finish_bot_response", (), "BOT_RESPONSE", "ENGAGED", 1, "Continuing unit 1..."),
+    ("advance_unit", (), "NEXT_UNIT", "ENGAGED", 2, "Moving to unit 2"),
+]
+
+ROLE_ICONS = {
+    RoleType.EXPLAINER: "💡",
+    RoleType.CHALLENGER: "🤔",
+    RoleType.SUMMARIZER: "📋",
+    RoleType.EXAMPLE_GENERATOR: "💼",
+    RoleType.MISCONCEPTION_SPOTTER: "⚠️"
+}
+
+# "<icon> <role>" labels, built once for all role tables
+ROLE_LABELS = {role: f"{ROLE_ICONS.get(role, '')} {role.value}" for role in RoleType}
+
+
+def print_header():
+    """Print fancy header"""
+    console.print(HEADER_BANNER, style="bold cyan", highlight=False)
     console.print()
+
+
+def get_processor():
+    """Get the shared demo DocumentProcessor; the embedding model loads in the background"""
+    from app.document.processor import get_document_processor
+    from app.document.segmenter import DEFAULT_EMBEDDING_CACHE_DIR
     
-    # Load document
-    console.print("📄 [cyan]Loading document:[/cyan] demo_document.txt")
-    processor = DocumentProcessor(
+    return get_document_processor(
         embedding_model='all-MiniLM-L6-v2',
-        similarity_threshold=0.75
+        similarity_threshold=0.75,
+        embedding_cache_dir=DEFAULT_EMBEDDING_CACHE_DIR,
+        load_model_in_background=True
     )
+
+
+def demo_stage_1_document_processing(processor=None):
+    """Stage 1: Document Processing Pipeline"""
+    with console:  # Rich buffers output inside this block and writes it once
+        console.print("\n" + "="*70, style="bold yellow")
+        console.print(Panel.fit(
+            "[bold green]STAGE 1: DOCUMENT PROCESSING PIPELINE[/bold green]",
+            border_style="green"
+        ))
+        console.print()
+        
+        # Load document
+        console.print("📄 [cyan]Loading document:[/cyan] demo_document.txt")
+    if processor is None:
+        processor = get_processor()
     
     with Progress() as progress:
         task = progress.add_task("[cyan]Processing...", total=4)
+        semantic_units = processor.process_document(
+            "demo_document.txt",
+            progress_callback=lambda stage: progress.update(
+                task, advance=1, description=f"[cyan]{stage}"
+            )
+        )
+    
+    with console:
+        console.print(f"✅ [green]Document processed successfully![/green]")
+        console.print()
         
-        progress.update(task, advance=1, description="[cyan]Loading file...")
-        time.sleep(0.3)
+        # Show summary
+        summary = processor.get_document_summary(semantic_units)
         
-        progress.update(task, advance=1, description="[cyan]Detecting headings...")
-        semantic_units = processor.process_document("demo_document.txt")
-        time.sleep(0.3)
+        summary_table = Table(title="Document Summary", box=box.ROUNDED, show_header=True)
+        summary_table.add_column("Metric", style="cyan", width=30)
+        summary_table.add_column("Value", style="yellow", width=30)
         
-        progress.update(task, advance=1, description="[cyan]Semantic segmentation...")
-        time.sleep(0.3)
+        summary_table.add_row("Total Semantic Units", str(summary['total_units']))
+        summary_table.add_row("Total Words", f"{summary['total_words']:,}")
+        summary_table.add_row("Avg Words per Unit", f"{summary['avg_words_per_unit']:.1f}")
+        summary_table.add_row("Avg Cohesion Score", f"{summary['avg_cohesion']:.3f}")
         
-        progress.update(task, advance=1, description="[cyan]Creating semantic units...")
-        time.sleep(0.3)
-    
-    console.print(f"✅ [green]Document processed successfully![/green]")
-    console.print()
-    
-    # Show summary
-    summary = processor.get_document_summary(semantic_units)
-    
-    summary_table = Table(title="Document Summary", box=box.ROUNDED, show_header=True)
-    summary_table.add_column("Metric", style="cyan", width=30)
-    summary_table.add_column("Value", style="yellow", width=30)
-    
-    summary_table.add_row("Total Semantic Units", str(summary['total_units']))
-    summary_table.add_row("Total Words", f"{summary['total_words']:,}")
-    summary_table.add_row("Avg Words per Unit", f"{summary['avg_words_per_unit']:.1f}")
-    summary_table.add_row("Avg Cohesion Score", f"{summary['avg_cohesion']:.3f}")
-    
-    console.print(summary_table)
-    console.print()
-    
-    # Show semantic units
-    units_table = Table(title="Semantic Units Detected", box=box.DOUBLE, show_header=True)
-    units_table.add_column("ID", style="cyan", width=8)
-    units_table.add_column("Section", style="magenta", width=25)
-    units_table.add_column("Words", style="yellow", justify="right", width=8)
-    units_table.add_column("Cohesion", style="green", justify="right", width=10)
-    units_table.add_column("Preview", style="white", width=40)
-    
-    for unit in semantic_units[:8]:  # Show first 8
-        preview = unit.text[:80].replace('\n', ' ') + "..."
-        units_table.add_row(
-            unit.id,
-            unit.title or "Body",
-            str(unit.word_count),
-            f"{unit.similarity_score:.3f}",
-            preview
-        )
-    
-    console.print(units_table)
+        console.print(summary_table)
+        console.print()
+        
+        # Show semantic units
+        units_table = Table(title="Semantic Units Detected", box=box.DOUBLE, show_header=True)
+        units_table.add_column("ID", style="cyan", width=8)
+        units_table.add_column("Section", style="magenta", width=25)
+        units_table.add_column("Words", style="yellow", justify="right", width=8)
+        units_table.add_column("Cohesion", style="green", justify="right", width=10)
+        units_table.add_column("Preview", style="white", width=40)
+        
+        unit_rows = [
+            (
+                unit.id,
+                unit.title or "Body",
+                str(unit.word_count),
+                f"{unit.similarity_score:.3f}",
+                unit.text[:80].translate(_NL_TRANS) + "...",
+            )
+            for unit in semantic_units[:8]  # Show first 8
+        ]
+        for row in unit_rows:
+            units_table.add_row(*row)
+        
+        console.print(units_table)
     
     return semantic_units
 
 
 def demo_stage_2_role_assignment(semantic_units):
     """Stage 2: Role Assignment"""
-    console.print("\n" + "="*70, style="bold yellow")
-    console.print(Panel.fit(
-        "[bold blue]STAGE 2: DETERMINISTIC ROLE ASSIGNMENT[/bold blue]",
-        border_style="blue"
-    ))
-    console.print()
+    with console:
+        console.print("\n" + "="*70, style="bold yellow")
+        console.print(Panel.fit(
+            "[bold blue]STAGE 2: DETERMINISTIC ROLE ASSIGNMENT[/bold blue]",
+            border_style="blue"
+        ))
+        console.print()
+        
+        console.print("🎭 [cyan]Assigning pedagogical roles to semantic units...[/cyan]")
+        console.print("   [dim]Formula: Score = 0.4×structural + 0.3×lexical + 0.3×topic[/dim]")
+        console.print()
     
-    console.print("🎭 [cyan]Assigning pedagogical roles to semantic units...[/cyan]")
-    console.print("   [dim]Formula: Score = 0.4×structural + 0.3×lexical + 0.3×topic[/dim]")
-    console.print()
+    from app.roles.role_assignment import get_role_assigner
     
-    assigner = RoleAssigner()
+    assigner = get_role_assigner()
     
     with Progress() as progress:
         task = progress.add_task("[blue]Computing scores...", total=len(semantic_units))
-        assignments = assigner.assign_roles(semantic_units, balance_roles=True)
-        progress.update(task, advance=len(semantic_units))
-    
-    console.print(f"✅ [green]Assigned {len(assignments)} roles![/green]")
-    console.print()
-    
-    # Show role distribution
-    stats = assigner.get_statistics(assignments)
-    
-    dist_table = Table(title="Role Distribution", box=box.ROUNDED)
-    dist_table.add_column("Role", style="cyan", width=25)
-    dist_table.add_column("Count", justify="right", style="yellow", width=10)
-    dist_table.add_column("Percentage", justify="right", style="green", width=12)
-    dist_table.add_column("Avg Confidence", justify="right", style="magenta", width=15)
-    
-    role_icons = {
-        RoleType.EXPLAINER: "💡",
-        RoleType.CHALLENGER: "🤔",
-        RoleType.SUMMARIZER: "📋",
-        RoleType.EXAMPLE_GENERATOR: "💼",
-        RoleType.MISCONCEPTION_SPOTTER: "⚠️"
-    }
-    
-    for role in RoleType:
-        icon = role_icons.get(role, "")
-        role_name = f"{icon} {role.value}"
-        count = stats['role_counts'][role]
-        pct = stats['role_percentages'][role]
-        conf = stats['average_confidences'][role]
-        dist_table.add_row(role_name, str(count), f"{pct:.1f}%", f"{conf:.3f}")
-    
-    console.print(dist_table)
-    console.print()
-    
-    # Show sample assignments
-    assign_table = Table(title="Sample Role Assignments (First 6)", box=box.DOUBLE)
-    assign_table.add_column("Unit", style="cyan", width=8)
-    assign_table.add_column("Role", style="magenta", width=25)
-    assign_table.add_column("Confidence", justify="right", style="green", width=12)
-    assign_table.add_column("Scores (S/L/T)", style="yellow", width=18)
-    assign_table.add_column("Content Preview", style="white", width=35)
-    
-    for assignment in assignments[:6]:
-        icon = role_icons.get(assignment.assigned_role, "")
-        role_name = f"{icon} {assignment.assigned_role.value}"
-        scores = f"{assignment.score.structural_score:.2f} / {assignment.score.lexical_score:.2f} / {assignment.score.topic_score:.2f}"
-        preview = assignment.semantic_unit.text[:60].replace('\n', ' ') + "..."
-        
-        assign_table.add_row(
-            assignment.semantic_unit.id,
-            role_name,
-            f"{assignment.confidence:.3f}",
-            scores,
-            preview
+        assignments, stats = assigner.assign_roles_with_statistics(
+            semantic_units, balance_roles=True
         )
+        progress.update(task, advance=len(semantic_units))
     
-    console.print(assign_table)
+    with console:
+        console.print(f"✅ [green]Assigned {len(assignments)} roles![/green]")
+        console.print()
+        
+        # Show role distribution
+        dist_table = Table(title="Role Distribution", box=box.ROUNDED)
+        dist_table.add_column("Role", style="cyan", width=25)
+        dist_table.add_column("Count", justify="right", style="yellow", width=10)
+        dist_table.add_column("Percentage", justify="right", style="green", width=12)
+        dist_table.add_column("Avg Confidence", justify="right", style="magenta", width=15)
+        
+        for role in RoleType:
+            role_name = ROLE_LABELS[role]
+            count = stats['role_counts'][role]
+            pct = stats['role_percentages'][role]
+            conf = stats['average_confidences'][role]
+            dist_table.add_row(role_name, str(count), f"{pct:.1f}%", f"{conf:.3f}")
+        
+        console.print(dist_table)
+        console.print()
+        
+        # Show sample assignments
+        assign_table = Table(title="Sample Role Assignments (First 6)", box=box.DOUBLE)
+        assign_table.add_column("Unit", style="cyan", width=8)
+        assign_table.add_column("Role", style="magenta", width=25)
+        assign_table.add_column("Confidence", justify="right", style="green", width=12)
+        assign_table.add_column("Scores (S/L/T)", style="yellow", width=18)
+        assign_table.add_column("Content Preview", style="white", width=35)
+        
+        assign_rows = [
+            (
+                a.semantic_unit.id,
+                ROLE_LABELS[a.assigned_role],
+                f"{a.confidence:.3f}",
+                f"{a.score.structural_score:.2f} / {a.score.lexical_score:.2f} / {a.score.topic_score:.2f}",
+                a.semantic_unit.text[:60].translate(_NL_TRANS) + "...",
+            )
+            for a in assignments[:6]
+        ]
+        for row in assign_rows:
+            assign_table.add_row(*row)
+        
+        console.print(assign_table)
     
     return assignments
 
 
 def demo_stage_3_state_machine(assignments):
     """Stage 3: Conversation State Machine"""
-    console.print("\n" + "="*70, style="bold yellow")
-    console.print(Panel.fit(
-        "[bold magenta]STAGE 3: INTERRUPTION-RESILIENT STATE MACHINE[/bold magenta]",
-        border_style="magenta"
-    ))
-    console.print()
-    
-    console.print("🔄 [cyan]Initializing conversation state machine...[/cyan]")
-    console.print()
-    
-    sm = ConversationStateMachine(session_id="demo_session")
-    
-    # Initialize
-    sm.transition(EventType.INITIALIZE)
-    console.print(f"   State: [yellow]IDLE[/yellow] → [green]{sm.context.current_state.value}[/green]")
-    
-    sm.transition(EventType.DOCUMENT_LOADED, {'total_units': len(assignments)})
-    sm.context.total_units = len(assignments)
-    console.print(f"   Loaded [cyan]{len(assignments)} semantic units[/cyan]")
-    console.print(f"   State: [green]{sm.context.current_state.value}[/green]")
-    
-    sm.transition(EventType.ROLES_ASSIGNED)
-    console.print(f"   Roles assigned → State: [green]{sm.context.current_state.value}[/green]")
-    
-    sm.transition(EventType.START_DIALOGUE)
-    console.print(f"   Dialogue started → State: [bold green]{sm.context.current_state.value}[/bold green]")
-    console.print()
-    
-    # Simulate conversation flow
-    flow_table = Table(title="Conversation Flow Simulation", box=box.HEAVY)
-    flow_table.add_column("Step", style="cyan", width=6)
-    flow_table.add_column("Event", style="yellow", width=20)
-    flow_table.add_column("State", style="green", width=15)
-    flow_table.add_column("Unit", justify="right", style="magenta", width=8)
-    flow_table.add_column("Description", style="white", width=40)
-    
-    step = 1
-    
-    # Unit 0
-    flow_table.add_row(str(step), "START_DIALOGUE", "ENGAGED", "0", "Bot explains first concept")
-    step += 1
-    
-    sm.start_bot_response()
-    flow_table.add_row(str(step), "BOT_RESPONSE", "ENGAGED", "0", "Bot is generating response...")
-    step += 1
-    
-    sm.finish_bot_response()
-    flow_table.add_row(str(step), "BOT_RESPONSE", "ENGAGED", "0", "Bot finished, awaiting user")
-    step += 1
-    
-    # Advance to unit 1
-    sm.advance_unit()
-    flow_table.add_row(str(step), "NEXT_UNIT", "ENGAGED", "1", "Moving to next concept")
-    step += 1
-    
-    sm.start_bot_response()
-    flow_table.add_row(str(step), "BOT_RESPONSE", "ENGAGED", "1", "Bot explaining unit 1...")
-    step += 1
-    
-    # USER INTERRUPTS!
-    result = sm.user_clicks_interrupt()
-    flow_table.add_row(
-        str(step), 
-        "[bold red]USER_INTERRUPT[/bold red]", 
-        "[bold red]INTERRUPTED[/bold red]", 
-        "1", 
-        "[bold]User clicks [INTERRUPT] button![/bold]"
-    )
-    step += 1
-    
-    # Process interruption
-    sm.process_interruption_message("Wait, I don't understand X")
-    flow_table.add_row(str(step), "USER_MESSAGE", "INTERRUPTED", "1", "User: 'I don't understand X'")
-    step += 1
-    
-    # Bot answers interruption
-    sm.start_bot_response()
-    flow_table.add_row(str(step), "BOT_RESPONSE", "INTERRUPTED", "1", "Bot clarifying user's question")
-    step += 1
-    
-    sm.finish_bot_response()
-    flow_table.add_row(str(step), "BOT_RESPONSE", "INTERRUPTED", "1", "Clarification complete")
-    step += 1
-    
-    # Resume
-    sm.resume_conversation()
-    flow_table.add_row(
-        str(step), 
-        "[bold green]RESUME[/bold green]", 
-        "[bold green]ENGAGED[/bold green]", 
-        "1", 
-        "[bold]Resumed from where we left off[/bold]"
-    )
-    step += 1
-    
-    # Continue
-    sm.finish_bot_response()
-    flow_table.add_row(str(step), "BOT_RESPONSE", "ENGAGED", "1", "Continuing unit 1...")
-    step += 1
-    
-    sm.advance_unit()
-    flow_table.add_row(str(step), "NEXT_UNIT", "ENGAGED", "2", "Moving to unit 2")
-    
-    console.print(flow_table)
-    console.print()
-    
-    # Show final state
-    summary = sm.get_state_summary()
-    
-    state_panel = Panel.fit(
-        f"""[bold]Current State Summary[/bold]
+    with console:
+        console.print("\n" + "="*70, style="bold yellow")
+        console.print(Panel.fit(
+            "[bold magenta]STAGE 3: INTERRUPTION-RESILIENT STATE MACHINE[/bold magenta]",
+            border_style="magenta"
+        ))
+        console.print()
+        
+        console.print("🔄 [cyan]Initializing conversation state machine...[/cyan]")
+        console.print()
+        
+        sm = ConversationStateMachine(session_id="demo_session")
+        
+        # Initialize
+        sm.transition(EventType.INITIALIZE)
+        console.print(f"   State: [yellow]IDLE[/yellow] → [green]{sm.context.current_state.value}[/green]")
+        
+        sm.transition(EventType.DOCUMENT_LOADED, {'total_units': len(assignments)})
+        sm.context.total_units = len(assignments)
+        console.print(f"   Loaded [cyan]{len(assignments)} semantic units[/cyan]")
+        console.print(f"   State: [green]{sm.context.current_state.value}[/green]")
+        
+        sm.transition(EventType.ROLES_ASSIGNED)
+        console.print(f"   Roles assigned → State: [green]{sm.context.current_state.value}[/green]")
+        
+        sm.transition(EventType.START_DIALOGUE)
+        console.print(f"   Dialogue started → State: [bold green]{sm.context.current_state.value}[/bold green]")
+        console.print()
+        
+        # Simulate conversation flow
+        flow_table = Table(title="Conversation Flow Simulation", box=box.HEAVY)
+        flow_table.add_column("Step", style="cyan", width=6)
+        flow_table.add_column("Event", style="yellow", width=20)
+        flow_table.add_column("State", style="green", width=15)
+        flow_table.add_column("Unit", justify="right", style="magenta", width=8)
+        flow_table.add_column("Description", style="white", width=40)
+        
+        for step, (method, args, event, state, unit, description) in enumerate(FLOW_SCRIPT, 1):
+            if method:
+                getattr(sm, method)(*args)
+            flow_table.add_row(str(step), event, state, str(unit), description)
+        
+        console.print(flow_table)
+        console.print()
+        
+        # Show final state
+        summary = sm.get_state_summary()
+        
+        state_panel = Panel.fit(
+            f"""[bold]Current State Summary[/bold]
 
 🔹 State: [green]{summary['current_state']}[/green]
 🔹 Current Unit: [cyan]{summary['progress']['current_unit']} / {summary['progress']['total_units']}[/cyan]
@@ -318,41 +290,42 @@ def demo_stage_3_state_machine(assignments):
 🔹 Bot Generating: [magenta]{summary['bot_status']['is_generating']}[/magenta]
 🔹 Awaiting Input: [blue]{summary['bot_status']['awaiting_input']}[/blue]
 """,
-        title="State Machine Status",
-        border_style="magenta"
-    )
-    
-    console.print(state_panel)
+            title="State Machine Status",
+            border_style="magenta"
+        )
+        
+        console.print(state_panel)
     
     return sm
 
 
 def demo_stage_4_test_results():
     """Stage 4: Show Test Results"""
-    console.print("\n" + "="*70, style="bold yellow")
-    console.print(Panel.fit(
-        "[bold green]STAGE 4: VERIFICATION & TESTING[/bold green]",
-        border_style="green"
-    ))
-    console.print()
-    
-    test_table = Table(title="Test Suite Results", box=box.DOUBLE_EDGE)
-    test_table.add_column("Module", style="cyan", width=30)
-    test_table.add_column("Tests", justify="right", style="yellow", width=10)
-    test_table.add_column("Status", style="green", width=15)
-    test_table.add_column("Coverage", style="magenta", width=15)
-    
-    test_table.add_row("conversation_state.py", "19", "✅ PASS", "Full")
-    test_table.add_row("role_assignment.py", "20", "✅ PASS", "Full")
-    test_table.add_row("role_templates.py", "19", "✅ PASS", "Full")
-    test_table.add_row("document processing", "24", "✅ PASS", "Full")
-    test_table.add_row("[bold]TOTAL[/bold]", "[bold]82[/bold]", "[bold green]✅ ALL PASS[/bold green]", "[bold]100%[/bold]")
-    
-    console.print(test_table)
-    console.print()
-    
-    features_panel = Panel(
-        """[bold cyan]✅ Implemented Features[/bold cyan]
+    with console:
+        console.print("\n" + "="*70, style="bold yellow")
+        console.print(Panel.fit(
+            "[bold green]STAGE 4: VERIFICATION & TESTING[/bold green]",
+            border_style="green"
+        ))
+        console.print()
+        
+        test_table = Table(title="Test Suite Results", box=box.DOUBLE_EDGE)
+        test_table.add_column("Module", style="cyan", width=30)
+        test_table.add_column("Tests", justify="right", style="yellow", width=10)
+        test_table.add_column("Status", style="green", width=15)
+        test_table.add_column("Coverage", style="magenta", width=15)
+        
+        test_table.add_row("conversation_state.py", "19", "✅ PASS", "Full")
+        test_table.add_row("role_assignment.py", "20", "✅ PASS", "Full")
+        test_table.add_row("role_templates.py", "19", "✅ PASS", "Full")
+        test_table.add_row("document processing", "24", "✅ PASS", "Full")
+        test_table.add_row("[bold]TOTAL[/bold]", "[bold]82[/bold]", "[bold green]✅ ALL PASS[/bold green]", "[bold]100%[/bold]")
+        
+        console.print(test_table)
+        console.print()
+        
+        features_panel = Panel(
+            """[bold cyan]✅ Implemented Features[/bold cyan]
 
 • [green]Document Processing Pipeline[/green]
   └─ PDF/TXT loading, heading detection, semantic segmentation
@@ -372,35 +345,39 @@ def demo_stage_4_test_results():
 • [green]Comprehensive Testing[/green]
   └─ 82 unit tests, all passing, 100% critical path coverage
 """,
-        title="System Features",
-        border_style="green",
-        box=box.ROUNDED
-    )
-    
-    console.print(features_panel)
+            title="System Features",
+            border_style="green",
+            box=box.ROUNDED
+        )
+        
+        console.print(features_panel)
 
 
-def main():
-    """Run complete demo"""
+def main(auto: bool = False):
+    """Run complete demo (auto=True skips the ENTER prompts)"""
+    pause = (lambda _prompt: None) if auto else input
+    
     print_header()
+    # Start the embedding model load now so it overlaps with the intro prompt
+    processor = get_processor()
     
     console.print("[bold yellow]Starting complete system demonstration...[/bold yellow]")
     console.print("[dim]This demo showcases all 4 core modules working together[/dim]")
     console.print()
     
-    input("Press ENTER to begin...")
+    pause("Press ENTER to begin...")
     
     # Stage 1: Document Processing
-    semantic_units = demo_stage_1_document_processing()
-    input("\nPress ENTER to continue to Role Assignment...")
+    semantic_units = demo_stage_1_document_processing(processor)
+    pause("\nPress ENTER to continue to Role Assignment...")
     
     # Stage 2: Role Assignment
     assignments = demo_stage_2_role_assignment(semantic_units)
-    input("\nPress ENTER to continue to State Machine...")
+    pause("\nPress ENTER to continue to State Machine...")
     
     # Stage 3: State Machine
     state_machine = demo_stage_3_state_machine(assignments)
-    input("\nPress ENTER to see test results...")
+    pause("\nPress ENTER to see test results...")
     
     # Stage 4: Test Results
     demo_stage_4_test_results()
@@ -428,8 +405,16 @@ def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RQSM-Engine interactive demo")
+    parser.add_argument(
+        "--auto",
+        action="store_true",
+        help="run non-interactively (no ENTER prompts), e.g. for timing or CI smoke runs"
+    )
+    args = parser.parse_args()
+    
     try:
-        main()
+        main(auto=args.auto)
     except KeyboardInterrupt:
         console.print("\n\n[yellow]Demo interrupted by user[/yellow]")
     except Exception as e:
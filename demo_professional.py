@@ -7,11 +7,13 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
+import argparse
+import heapq
 import sys
 
-# Import our modules
-from app.document.processor import DocumentProcessor
-from app.roles.role_assignment import RoleAssigner
+# Import our modules. DocumentProcessor and RoleAssigner pull in
+# sentence-transformers/torch, so they are imported where first used to let
+# the header render immediately.
 from app.roles.role_templates import RoleType
 from app.state_machine.conversation_state import (
     ConversationStateMachine,
@@ -24,296 +26,329 @@ if sys.platform == "win32":
 
 console = Console()
 
+# Flattens line breaks and tabs in single-line text previews
+_NL_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+# Stage 3 conversation script: (state machine method, args, event, state,
+# unit, description, emphasis). The first row is the START_DIALOGUE already
+# applied.
+FLOW_SCRIPT = [
+    (None, (), "START_DIALOGUE", "ENGAGED", 0, "System initiates dialogue on first concept", False),
+    ("start_bot_response", (), "BOT_RESPONSE", "ENGAGED", 0, "Bot begins generating response", False),
+    ("finish_bot_response", (), "BOT_RESPONSE", "ENGAGED", 0, "Response complete, awaiting user input", False),
+    ("advance_unit", (), "NEXT_UNIT", "ENGAGED", 1, "Advancing to next semantic unit", False),
+    ("start_bot_response", (), "BOT_RESPONSE", "ENGAGED", 1, "Bot presenting next concept", False),
+    ("user_clicks_interrupt", (), "USER_INTERRUPT", "INTERRUPTED", 1, "User initiates interruption (button click)", True),
+    ("process_interruption_message", ("Clarification needed on previous point",),
+     "USER_MESSAGE", "INTERRUPTED", 1, "User submits clarification question", False),
+    ("start_bot_response", (), "BOT_RESPONSE", "INTERRUPTED", 1, "Bot addresses interruption query", False),
+    ("finish_bot_response", (), "BOT_RESPONSE", "INTERRUPTED", 1, "Clarification complete", False),
+    ("resume_conversation", (), "RESUME", "ENGAGED", 1, "Conversation resumed at interruption point", True),
+    ("finish_bot_response", (), "BOT_RESPONSE", "ENGAGED", 1, "Continuing with interrupted topic", False),
+    ("advance_unit", (), "NEXT_UNIT", "ENGAGED", 2, "Proceeding to subsequent unit", False),
+]
+
+ROLE_NAMES = {
+    RoleType.EXPLAINER: "Explainer",
+    RoleType.CHALLENGER: "Challenger",
+    RoleType.SUMMARIZER: "Summarizer",
+    RoleType.EXAMPLE_GENERATOR: "Example Generator",
+    RoleType.MISCONCEPTION_SPOTTER: "Misconception Spotter"
+}
+
 def print_header():
     """Print professional header"""
-    console.print("\n")
-    console.print("="*80, style="bold blue")
-    console.print("  RQSM-ENGINE: Role-Queue State Machine Learning System", style="bold blue")
-    console.print("  Capstone Project Progress Demonstration", style="bold blue")
-    console.print("="*80, style="bold blue")
-    console.print()
+    with console:  # Rich buffers output inside this block and writes it once
+        console.print("\n")
+        console.print("="*80, style="bold blue")
+        console.print("  RQSM-ENGINE: Role-Queue State Machine Learning System", style="bold blue")
+        console.print("  Capstone Project Progress Demonstration", style="bold blue")
+        console.print("="*80, style="bold blue")
+        console.print()
 
-def demo_document_processing():
+def demo_document_processing(processor=None):
     """Stage 1: Document Processing"""
-    console.print("\n" + "="*80)
-    console.print("[bold cyan]STAGE 1: DOCUMENT PROCESSING PIPELINE[/bold cyan]")
-    console.print("="*80 + "\n")
-    
-    processor = DocumentProcessor()
+    with console:
+        console.print("\n" + "="*80)
+        console.print("[bold cyan]STAGE 1: DOCUMENT PROCESSING PIPELINE[/bold cyan]")
+        console.print("="*80 + "\n")
+    
+    if processor is None:
+        from app.document.processor import get_document_processor
+        from app.document.segmenter import DEFAULT_EMBEDDING_CACHE_DIR
+        processor = get_document_processor(embedding_cache_dir=DEFAULT_EMBEDDING_CACHE_DIR)
     semantic_units = processor.process_document("demo_document.txt")
-    
-    # Summary table
-    summary_table = Table(title="Document Analysis Results", box=box.ROUNDED, show_header=False)
-    summary_table.add_column("Metric", style="cyan", width=30)
-    summary_table.add_column("Value", style="white", width=40)
-    
-    summary_table.add_row("Source Document", "demo_document.txt")
-    summary_table.add_row("Total Semantic Units", str(len(semantic_units)))
-    summary_table.add_row("Total Words", f"{sum(u.word_count for u in semantic_units):,}")
-    summary_table.add_row("Average Words per Unit", f"{sum(u.word_count for u in semantic_units)/len(semantic_units):.1f}")
-    summary_table.add_row("Average Cohesion Score", f"{sum(u.similarity_score for u in semantic_units)/len(semantic_units):.3f}")
-    
-    console.print(summary_table)
-    console.print()
-    
-    # Semantic units table
-    units_table = Table(title="Extracted Semantic Units", box=box.DOUBLE, show_header=True)
-    units_table.add_column("Unit ID", style="cyan", width=10)
-    units_table.add_column("Section Title", style="magenta", width=30)
-    units_table.add_column("Words", style="yellow", justify="right", width=8)
-    units_table.add_column("Cohesion", style="green", justify="right", width=10)
-    units_table.add_column("Content Preview", style="white", width=45)
-    
-    for unit in semantic_units:
-        preview = unit.text[:70].replace('\n', ' ') + "..."
-        units_table.add_row(
-            unit.id,
-            unit.title or "Body Text",
-            str(unit.word_count),
-            f"{unit.similarity_score:.3f}",
-            preview
-        )
-    
-    console.print(units_table)
+    summary = processor.get_document_summary(semantic_units)
+    
+    with console:
+        # Summary table
+        summary_table = Table(title="Document Analysis Results", box=box.ROUNDED, show_header=False)
+        summary_table.add_column("Metric", style="cyan", width=30)
+        summary_table.add_column("Value", style="white", width=40)
+        
+        summary_table.add_row("Source Document", "demo_document.txt")
+        summary_table.add_row("Total Semantic Units", str(summary['total_units']))
+        summary_table.add_row("Total Words", f"{summary['total_words']:,}")
+        summary_table.add_row("Average Words per Unit", f"{summary['avg_words_per_unit']:.1f}")
+        summary_table.add_row("Average Cohesion Score", f"{summary['avg_cohesion']:.3f}")
+        
+        console.print(summary_table)
+        console.print()
+        
+        # Semantic units table
+        units_table = Table(title="Extracted Semantic Units", box=box.DOUBLE, show_header=True)
+        units_table.add_column("Unit ID", style="cyan", width=10)
+        units_table.add_column("Section Title", style="magenta", width=30)
+        units_table.add_column("Words", style="yellow", justify="right", width=8)
+        units_table.add_column("Cohesion", style="green", justify="right", width=10)
+        units_table.add_column("Content Preview", style="white", width=45)
+        
+        unit_rows = [
+            (
+                unit.id,
+                unit.title or "Body Text",
+                str(unit.word_count),
+                f"{unit.similarity_score:.3f}",
+                unit.text[:70].translate(_NL_TRANS) + "...",
+            )
+            for unit in semantic_units
+        ]
+        for row in unit_rows:
+            units_table.add_row(*row)
+        
+        console.print(units_table)
     
     return semantic_units
 
 def demo_role_assignment(semantic_units):
     """Stage 2: Role Assignment"""
-    console.print("\n" + "="*80)
-    console.print("[bold blue]STAGE 2: PEDAGOGICAL ROLE ASSIGNMENT[/bold blue]")
-    console.print("="*80 + "\n")
-    
-    console.print("[dim]Scoring Formula: Total = 0.4 × Structural + 0.3 × Lexical + 0.3 × Topic[/dim]\n")
-    
-    assigner = RoleAssigner()
-    assignments = assigner.assign_roles(semantic_units, balance_roles=True)
-    stats = assigner.get_statistics(assignments)
-    
-    # Role distribution table
-    dist_table = Table(title="Role Distribution Across Document", box=box.ROUNDED)
-    dist_table.add_column("Pedagogical Role", style="cyan", width=30)
-    dist_table.add_column("Count", justify="right", style="yellow", width=10)
-    dist_table.add_column("Percentage", justify="right", style="green", width=12)
-    dist_table.add_column("Avg Confidence", justify="right", style="magenta", width=15)
-    
-    role_names = {
-        RoleType.EXPLAINER: "Explainer",
-        RoleType.CHALLENGER: "Challenger",
-        RoleType.SUMMARIZER: "Summarizer",
-        RoleType.EXAMPLE_GENERATOR: "Example Generator",
-        RoleType.MISCONCEPTION_SPOTTER: "Misconception Spotter"
-    }
-    
-    for role in RoleType:
-        dist_table.add_row(
-            role_names[role],
-            str(stats['role_counts'][role]),
-            f"{stats['role_percentages'][role]:.1f}%",
-            f"{stats['average_confidences'][role]:.3f}"
-        )
-    
-    console.print(dist_table)
-    console.print()
-    
-    # Detailed assignments table
-    assign_table = Table(title="Role Assignment Details (Highest Confidence)", box=box.DOUBLE)
-    assign_table.add_column("Unit", style="cyan", width=8)
-    assign_table.add_column("Assigned Role", style="magenta", width=25)
-    assign_table.add_column("Confidence", justify="right", style="green", width=12)
-    assign_table.add_column("Score Components (S/L/T)", style="yellow", width=20)
-    assign_table.add_column("Content", style="white", width=40)
-    
-    sorted_assignments = sorted(assignments, key=lambda x: x.confidence, reverse=True)
-    for a in sorted_assignments[:8]:
-        scores = f"{a.score.structural_score:.2f}/{a.score.lexical_score:.2f}/{a.score.topic_score:.2f}"
-        assign_table.add_row(
-            a.semantic_unit.id,
-            role_names[a.assigned_role],
-            f"{a.confidence:.3f}",
-            scores,
-            a.semantic_unit.text[:55].replace('\n', ' ') + "..."
-        )
+    with console:
+        console.print("\n" + "="*80)
+        console.print("[bold blue]STAGE 2: PEDAGOGICAL ROLE ASSIGNMENT[/bold blue]")
+        console.print("="*80 + "\n")
+        
+        console.print("[dim]Scoring Formula: Total = 0.4 × Structural + 0.3 × Lexical + 0.3 × Topic[/dim]\n")
+    
+    from app.roles.role_assignment import get_role_assigner
+    
+    assigner = get_role_assigner()
+    assignments, stats = assigner.assign_roles_with_statistics(
+        semantic_units, balance_roles=True
+    )
     
-    console.print(assign_table)
+    with console:
+        # Role distribution table
+        dist_table = Table(title="Role Distribution Across Document", box=box.ROUNDED)
+        dist_table.add_column("Pedagogical Role", style="cyan", width=30)
+        dist_table.add_column("Count", justify="right", style="yellow", width=10)
+        dist_table.add_column("Percentage", justify="right", style="green", width=12)
+        dist_table.add_column("Avg Confidence", justify="right", style="magenta", width=15)
+        
+        for role in RoleType:
+            dist_table.add_row(
+                ROLE_NAMES[role],
+                str(stats['role_counts'][role]),
+                f"{stats['role_percentages'][role]:.1f}%",
+                f"{stats['average_confidences'][role]:.3f}"
+            )
+        
+        console.print(dist_table)
+        console.print()
+        
+        # Detailed assignments table
+        assign_table = Table(title="Role Assignment Details (Highest Confidence)", box=box.DOUBLE)
+        assign_table.add_column("Unit", style="cyan", width=8)
+        assign_table.add_column("Assigned Role", style="magenta", width=25)
+        assign_table.add_column("Confidence", justify="right", style="green", width=12)
+        assign_table.add_column("Score Components (S/L/T)", style="yellow", width=20)
+        assign_table.add_column("Content", style="white", width=40)
+        
+        top_assignments = heapq.nlargest(8, assignments, key=lambda a: a.confidence)
+        assign_rows = [
+            (
+                a.semantic_unit.id,
+                ROLE_NAMES[a.assigned_role],
+                f"{a.confidence:.3f}",
+                f"{a.score.structural_score:.2f}/{a.score.lexical_score:.2f}/{a.score.topic_score:.2f}",
+                a.semantic_unit.text[:55].translate(_NL_TRANS) + "...",
+            )
+            for a in top_assignments
+        ]
+        for row in assign_rows:
+            assign_table.add_row(*row)
+        
+        console.print(assign_table)
     
     return assignments
 
 def demo_state_machine(assignments):
     """Stage 3: State Machine"""
-    console.print("\n" + "="*80)
-    console.print("[bold magenta]STAGE 3: CONVERSATION STATE MACHINE[/bold magenta]")
-    console.print("="*80 + "\n")
-    
-    sm = ConversationStateMachine(session_id="demo_session")
-    sm.transition(EventType.INITIALIZE)
-    sm.transition(EventType.DOCUMENT_LOADED, {'total_units': len(assignments)})
-    sm.context.total_units = len(assignments)
-    sm.transition(EventType.ROLES_ASSIGNED)
-    sm.transition(EventType.START_DIALOGUE)
-    
-    # Conversation flow table
-    flow_table = Table(title="Interruption-Resilient Conversation Flow", box=box.HEAVY)
-    flow_table.add_column("Step", style="cyan", width=6)
-    flow_table.add_column("Event Type", style="yellow", width=20)
-    flow_table.add_column("State", style="green", width=15)
-    flow_table.add_column("Unit", style="magenta", width=6)
-    flow_table.add_column("Action Description", style="white", width=50)
-    
-    # Simulate normal flow
-    flow_table.add_row("1", "START_DIALOGUE", "ENGAGED", "0", "System initiates dialogue on first concept")
-    sm.start_bot_response()
-    flow_table.add_row("2", "BOT_RESPONSE", "ENGAGED", "0", "Bot begins generating response")
-    sm.finish_bot_response()
-    flow_table.add_row("3", "BOT_RESPONSE", "ENGAGED", "0", "Response complete, awaiting user input")
-    sm.advance_unit()
-    flow_table.add_row("4", "NEXT_UNIT", "ENGAGED", "1", "Advancing to next semantic unit")
-    sm.start_bot_response()
-    flow_table.add_row("5", "BOT_RESPONSE", "ENGAGED", "1", "Bot presenting next concept")
-    
-    # User interrupts
-    sm.user_clicks_interrupt()
-    flow_table.add_row("[bold]6[/bold]", "[bold]USER_INTERRUPT[/bold]", "[bold]INTERRUPTED[/bold]", "[bold]1[/bold]", "[bold]User initiates interruption (button click)[/bold]")
-    sm.process_interruption_message("Clarification needed on previous point")
-    flow_table.add_row("7", "USER_MESSAGE", "INTERRUPTED", "1", "User submits clarification question")
-    sm.start_bot_response()
-    flow_table.add_row("8", "BOT_RESPONSE", "INTERRUPTED", "1", "Bot addresses interruption query")
-    sm.finish_bot_response()
-    flow_table.add_row("9", "BOT_RESPONSE", "INTERRUPTED", "1", "Clarification complete")
-    
-    # Resume
-    sm.resume_conversation()
-    flow_table.add_row("[bold]10[/bold]", "[bold]RESUME[/bold]", "[bold]ENGAGED[/bold]", "[bold]1[/bold]", "[bold]Conversation resumed at interruption point[/bold]")
-    sm.finish_bot_response()
-    flow_table.add_row("11", "BOT_RESPONSE", "ENGAGED", "1", "Continuing with interrupted topic")
-    sm.advance_unit()
-    flow_table.add_row("12", "NEXT_UNIT", "ENGAGED", "2", "Proceeding to subsequent unit")
-    
-    console.print(flow_table)
-    console.print()
-    
-    # State summary
-    summary = sm.get_state_summary()
-    state_table = Table(title="Current System State", box=box.ROUNDED, show_header=False)
-    state_table.add_column("Attribute", style="cyan", width=25)
-    state_table.add_column("Value", style="white", width=40)
-    
-    state_table.add_row("Current State", summary['current_state'].upper())
-    state_table.add_row("Current Unit", f"{summary['progress']['current_unit']} of {summary['progress']['total_units']}")
-    state_table.add_row("Progress Percentage", f"{summary['progress']['percentage']:.1f}%")
-    state_table.add_row("Total Interruptions", str(summary['interruptions']))
-    state_table.add_row("Bot Generating", str(summary['bot_status']['is_generating']))
-    state_table.add_row("Awaiting User Input", str(summary['bot_status']['awaiting_input']))
-    
-    console.print(state_table)
+    with console:
+        console.print("\n" + "="*80)
+        console.print("[bold magenta]STAGE 3: CONVERSATION STATE MACHINE[/bold magenta]")
+        console.print("="*80 + "\n")
+        
+        sm = ConversationStateMachine(session_id="demo_session")
+        sm.transition(EventType.INITIALIZE)
+        sm.transition(EventType.DOCUMENT_LOADED, {'total_units': len(assignments)})
+        sm.context.total_units = len(assignments)
+        sm.transition(EventType.ROLES_ASSIGNED)
+        sm.transition(EventType.START_DIALOGUE)
+        
+        # Conversation flow table
+        flow_table = Table(title="Interruption-Resilient Conversation Flow", box=box.HEAVY)
+        flow_table.add_column("Step", style="cyan", width=6)
+        flow_table.add_column("Event Type", style="yellow", width=20)
+        flow_table.add_column("State", style="green", width=15)
+        flow_table.add_column("Unit", style="magenta", width=6)
+        flow_table.add_column("Action Description", style="white", width=50)
+        
+        for step, (method, args, event, state, unit, description, emphasis) in enumerate(FLOW_SCRIPT, 1):
+            if method:
+                getattr(sm, method)(*args)
+            row = (str(step), event, state, str(unit), description)
+            if emphasis:
+                row = tuple(f"[bold]{cell}[/bold]" for cell in row)
+            flow_table.add_row(*row)
+        
+        console.print(flow_table)
+        console.print()
+        
+        # State summary
+        summary = sm.get_state_summary()
+        state_table = Table(title="Current System State", box=box.ROUNDED, show_header=False)
+        state_table.add_column("Attribute", style="cyan", width=25)
+        state_table.add_column("Value", style="white", width=40)
+        
+        state_table.add_row("Current State", summary['current_state'].upper())
+        state_table.add_row("Current Unit", f"{summary['progress']['current_unit']} of {summary['progress']['total_units']}")
+        state_table.add_row("Progress Percentage", f"{summary['progress']['percentage']:.1f}%")
+        state_table.add_row("Total Interruptions", str(summary['interruptions']))
+        state_table.add_row("Bot Generating", str(summary['bot_status']['is_generating']))
+        state_table.add_row("Awaiting User Input", str(summary['bot_status']['awaiting_input']))
+        
+        console.print(state_table)
 
 def demo_test_results():
     """Stage 4: Testing Results"""
-    console.print("\n" + "="*80)
-    console.print("[bold green]STAGE 4: TESTING AND VERIFICATION[/bold green]")
-    console.print("="*80 + "\n")
-    
-    test_table = Table(title="Unit Test Suite Results", box=box.DOUBLE_EDGE)
-    test_table.add_column("Module", style="cyan", width=35)
-    test_table.add_column("Test Count", justify="right", style="yellow", width=12)
-    test_table.add_column("Status", style="green", width=15)
-    test_table.add_column("Coverage", style="magenta", width=15)
-    
-    test_table.add_row("conversation_state.py", "19", "PASS", "Complete")
-    test_table.add_row("role_assignment.py", "20", "PASS", "Complete")
-    test_table.add_row("role_templates.py", "19", "PASS", "Complete")
-    test_table.add_row("document_processing/", "24", "PASS", "Complete")
-    test_table.add_row("[bold]TOTAL[/bold]", "[bold]82[/bold]", "[bold]ALL PASS[/bold]", "[bold]100%[/bold]")
-    
-    console.print(test_table)
+    with console:
+        console.print("\n" + "="*80)
+        console.print("[bold green]STAGE 4: TESTING AND VERIFICATION[/bold green]")
+        console.print("="*80 + "\n")
+        
+        test_table = Table(title="Unit Test Suite Results", box=box.DOUBLE_EDGE)
+        test_table.add_column("Module", style="cyan", width=35)
+        test_table.add_column("Test Count", justify="right", style="yellow", width=12)
+        test_table.add_column("Status", style="green", width=15)
+        test_table.add_column("Coverage", style="magenta", width=15)
+        
+        test_table.add_row("conversation_state.py", "19", "PASS", "Complete")
+        test_table.add_row("role_assignment.py", "20", "PASS", "Complete")
+        test_table.add_row("role_templates.py", "19", "PASS", "Complete")
+        test_table.add_row("document_processing/", "24", "PASS", "Complete")
+        test_table.add_row("[bold]TOTAL[/bold]", "[bold]82[/bold]", "[bold]ALL PASS[/bold]", "[bold]100%[/bold]")
+        
+        console.print(test_table)
 
 def print_summary():
     """Final project status summary"""
-    console.print("\n" + "="*80)
-    console.print("[bold]PROJECT STATUS SUMMARY[/bold]")
-    console.print("="*80 + "\n")
-    
-    # Completed components
-    completed_table = Table(title="Phase 1: Completed Backend Components", box=box.ROUNDED)
-    completed_table.add_column("Component", style="cyan", width=30)
-    completed_table.add_column("Description", style="white", width=60)
-    
-    completed_table.add_row(
-        "Document Processing",
-        "PDF/TXT loading, heading detection, semantic segmentation"
-    )
-    completed_table.add_row(
-        "Role Assignment System",
-        "Deterministic multi-factor scoring (structural, lexical, topic)"
-    )
-    completed_table.add_row(
-        "5 Pedagogical Roles",
-        "Explainer, Challenger, Summarizer, Example Generator, Misconception Spotter"
-    )
-    completed_table.add_row(
-        "State Machine",
-        "6 states, 13 events, interruption-resilient conversation flow"
-    )
-    completed_table.add_row(
-        "Test Suite",
-        "82 unit tests with 100% pass rate, comprehensive coverage"
-    )
+    with console:
+        console.print("\n" + "="*80)
+        console.print("[bold]PROJECT STATUS SUMMARY[/bold]")
+        console.print("="*80 + "\n")
+        
+        # Completed components
+        completed_table = Table(title="Phase 1: Completed Backend Components", box=box.ROUNDED)
+        completed_table.add_column("Component", style="cyan", width=30)
+        completed_table.add_column("Description", style="white", width=60)
+        
+        completed_table.add_row(
+            "Document Processing",
+            "PDF/TXT loading, heading detection, semantic segmentation"
+        )
+        completed_table.add_row(
+            "Role Assignment System",
+            "Deterministic multi-factor scoring (structural, lexical, topic)"
+        )
+        completed_table.add_row(
+            "5 Pedagogical Roles",
+            "Explainer, Challenger, Summarizer, Example Generator, Misconception Spotter"
+        )
+        completed_table.add_row(
+            "State Machine",
+            "6 states, 13 events, interruption-resilient conversation flow"
+        )
+        completed_table.add_row(
+            "Test Suite",
+            "82 unit tests with 100% pass rate, comprehensive coverage"
+        )
+        
+        console.print(completed_table)
+        console.print()
+        
+        # Remaining work
+        remaining_table = Table(title="Phase 2: Remaining Implementation Tasks", box=box.ROUNDED)
+        remaining_table.add_column("Component", style="yellow", width=30)
+        remaining_table.add_column("Description", style="white", width=60)
+        
+        remaining_table.add_row(
+            "REST API Layer",
+            "FastAPI endpoints for conversation management"
+        )
+        remaining_table.add_row(
+            "Frontend Interface",
+            "Web-based chat UI for user interaction"
+        )
+        remaining_table.add_row(
+            "LLM Integration",
+            "OpenAI/Anthropic API integration for response generation"
+        )
+        remaining_table.add_row(
+            "Database Layer",
+            "Persistent storage for sessions and conversation history"
+        )
+        remaining_table.add_row(
+            "Integration Testing",
+            "End-to-end testing with complete system flow"
+        )
+        
+        console.print(remaining_table)
+        console.print()
+        
+        console.print("[bold white]Current Milestone:[/bold white] Backend Architecture Complete")
+        console.print("[dim]Next Milestone: API Development and Frontend Integration[/dim]")
+        console.print()
+
+def main(auto: bool = False):
+    """Run all demonstrations (auto=True skips the ENTER prompts)"""
+    pause = (lambda _prompt: None) if auto else input
     
-    console.print(completed_table)
-    console.print()
+    print_header()
     
-    # Remaining work
-    remaining_table = Table(title="Phase 2: Remaining Implementation Tasks", box=box.ROUNDED)
-    remaining_table.add_column("Component", style="yellow", width=30)
-    remaining_table.add_column("Description", style="white", width=60)
+    from app.document.processor import get_document_processor
+    from app.document.segmenter import DEFAULT_EMBEDDING_CACHE_DIR
     
-    remaining_table.add_row(
-        "REST API Layer",
-        "FastAPI endpoints for conversation management"
-    )
-    remaining_table.add_row(
-        "Frontend Interface",
-        "Web-based chat UI for user interaction"
-    )
-    remaining_table.add_row(
-        "LLM Integration",
-        "OpenAI/Anthropic API integration for response generation"
-    )
-    remaining_table.add_row(
-        "Database Layer",
-        "Persistent storage for sessions and conversation history"
-    )
-    remaining_table.add_row(
-        "Integration Testing",
-        "End-to-end testing with complete system flow"
+    # Start the embedding model load in the background while Stage 1 renders
+    processor = get_document_processor(
+        embedding_cache_dir=DEFAULT_EMBEDDING_CACHE_DIR,
+        load_model_in_background=True
     )
     
-    console.print(remaining_table)
-    console.print()
-    
-    console.print("[bold white]Current Milestone:[/bold white] Backend Architecture Complete")
-    console.print("[dim]Next Milestone: API Development and Frontend Integration[/dim]")
-    console.print()
-
-def main():
-    """Run all demonstrations"""
-    print_header()
-    
     # Stage 1
-    semantic_units = demo_document_processing()
-    input("\n[Press ENTER to continue to Role Assignment...]")
+    semantic_units = demo_document_processing(processor)
+    pause("\n[Press ENTER to continue to Role Assignment...]")
     
     # Stage 2
     assignments = demo_role_assignment(semantic_units)
-    input("\n[Press ENTER to continue to State Machine...]")
+    pause("\n[Press ENTER to continue to State Machine...]")
     
     # Stage 3
     demo_state_machine(assignments)
-    input("\n[Press ENTER to continue to Test Results...]")
+    pause("\n[Press ENTER to continue to Test Results...]")
     
     # Stage 4
     demo_test_results()
-    input("\n[Press ENTER to see Project Summary...]")
+    pause("\n[Press ENTER to see Project Summary...]")
     
     # Summary
     print_summary()
@@ -323,8 +358,16 @@ def main():
     console.print("="*80 + "\n")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RQSM-Engine professional demo")
+    parser.add_argument(
+        "--auto",
+        action="store_true",
+        help="run non-interactively (no ENTER prompts), e.g. for timing or CI smoke runs"
+    )
+    args = parser.parse_args()
+    
     try:
-        main()
+        main(auto=args.auto)
     except KeyboardInterrupt:
         console.print("\n\n[yellow]Demonstration interrupted by user[/yellow]\n")
     except Exception as e:
@@ -8,11 +8,11 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich import box
+import argparse
+import heapq
 import time
 
-# Import our modules
-from app.document.processor import DocumentProcessor
-from app.roles.role_assignment import RoleAssigner
+# Import our modules (the heavy ones are imported in main())
 from app.roles.role_templates import RoleType
 from app.state_machine.conversation_state import (
     ConversationStateMachine,
@@ -21,180 +21,63 @@ from app.state_machine.conversation_state import (
 
 console = Console()
 
-def main():
-    # Header
-    console.print("\n")
-    console.print("╔═══════════════════════════════════════════════════════════════╗", style="bold cyan")
-    console.print("║   RQSM-ENGINE: Deterministic Multi-Role Learning Engine      ║", style="bold cyan")
-    console.print("║   Capstone Project - Progress Demonstration                  ║", style="bold cyan")
-    console.print("║   Phase 1 Complete: Core Backend | Tests: 82/82 Passing      ║", style="bold cyan")
-    console.print("╚═══════════════════════════════════════════════════════════════╝", style="bold cyan")
-    console.print()
-    
-    # STAGE 1
-    console.print(Panel("[bold green]STAGE 1: DOCUMENT PROCESSING[/bold green]", border_style="green"))
-    processor = DocumentProcessor()
-    semantic_units = processor.process_document("demo_document.txt")
-    
-    # Document stats
-    stats_table = Table(box=box.ROUNDED, show_header=False)
-    stats_table.add_column("", style="cyan", width=25)
-    stats_table.add_column("", style="yellow")
-    stats_table.add_row("📄 Document", "demo_document.txt")
-    stats_table.add_row("📊 Semantic Units", f"{len(semantic_units)}")
-    stats_table.add_row("📝 Total Words", f"{sum(u.word_count for u in semantic_units)}")
-    stats_table.add_row("🎯 Avg Cohesion", f"{sum(u.similarity_score for u in semantic_units)/len(semantic_units):.3f}")
-    console.print(stats_table)
-    console.print()
-    
-    # Units preview
-    units_table = Table(title="Semantic Units", box=box.HEAVY, show_header=True)
-    units_table.add_column("ID", style="cyan", width=8)
-    units_table.add_column("Section", style="magenta", width=30)
-    units_table.add_column("Words", style="yellow", justify="right")
-    units_table.add_column("Preview", style="white", width=45)
-    
-    for unit in semantic_units[:6]:
-        preview = unit.text[:80].replace('\n', ' ') + "..."
-        units_table.add_row(unit.id, unit.title or "Body", str(unit.word_count), preview)
-    console.print(units_table)
-    console.print()
-    
-    # STAGE 2
-    console.print(Panel("[bold blue]STAGE 2: ROLE ASSIGNMENT[/bold blue]", border_style="blue"))
-    assigner = RoleAssigner()
-    assignments = assigner.assign_roles(semantic_units, balance_roles=True)
-    stats = assigner.get_statistics(assignments)
-    
-    # Role distribution
-    role_table = Table(title="Role Distribution (Deterministic Scoring)", box=box.ROUNDED)
-    role_table.add_column("Role", style="cyan", width=28)
-    role_table.add_column("Count", justify="right", style="yellow")
-    role_table.add_column("%", justify="right", style="green")
-    role_table.add_column("Avg Score", justify="right", style="magenta")
-    
-    icons = {
-        RoleType.EXPLAINER: "💡",
-        RoleType.CHALLENGER: "🤔",
-        RoleType.SUMMARIZER: "📋",
-        RoleType.EXAMPLE_GENERATOR: "💼",
-        RoleType.MISCONCEPTION_SPOTTER: "⚠️"
-    }
-    
-    for role in RoleType:
-        icon = icons.get(role, "")
-        role_table.add_row(
-            f"{icon} {role.value}",
-            str(stats['role_counts'][role]),
-            f"{stats['role_percentages'][role]:.1f}%",
-            f"{stats['average_confidences'][role]:.3f}"
-        )
-    console.print(role_table)
-    console.print()
-    
-    # Sample assignments
-    assign_table = Table(title="Sample Assignments (Top 5)", box=box.DOUBLE)
-    assign_table.add_column("Unit", style="cyan")
-    assign_table.add_column("Role", style="magenta", width=28)
-    assign_table.add_column("Score", justify="right", style="green")
-    assign_table.add_column("Content", style="white", width=40)
-    
-    for a in sorted(assignments, key=lambda x: x.confidence, reverse=True)[:5]:
-        icon = icons.get(a.assigned_role, "")
-        assign_table.add_row(
-            a.semantic_unit.id,
-            f"{icon} {a.assigned_role.value}",
-            f"{a.confidence:.3f}",
-            a.semantic_unit.text[:60].replace('\n', ' ') + "..."
-        )
-    console.print(assign_table)
-    console.print()
-    
-    # STAGE 3
-    console.print(Panel("[bold magenta]STAGE 3: STATE MACHINE (Interruption Flow)[/bold magenta]", border_style="magenta"))
-    sm = ConversationStateMachine(session_id="demo")
-    sm.transition(EventType.INITIALIZE)
-    sm.transition(EventType.DOCUMENT_LOADED, {'total_units': len(assignments)})
-    sm.context.total_units = len(assignments)
-    sm.transition(EventType.ROLES_ASSIGNED)
-    sm.transition(EventType.START_DIALOGUE)
-    
-    # Conversation flow
-    flow_table = Table(title="Conversation Flow with Interruption", box=box.HEAVY)
-    flow_table.add_column("Step", style="cyan", width=5)
-    flow_table.add_column("Event", style="yellow", width=22)
-    flow_table.add_column("State", style="green", width=15)
-    flow_table.add_column("Unit", style="magenta", width=5)
-    flow_table.add_column("Action", style="white", width=45)
-    
-    flow_table.add_row("1", "START_DIALOGUE", "ENGAGED", "0", "💡 Explainer: Teaching first concept")
-    sm.start_bot_response()
-    flow_table.add_row("2", "BOT_RESPONSE", "ENGAGED", "0", "Bot is generating response...")
-    sm.finish_bot_response()
-    flow_table.add_row("3", "BOT_RESPONSE", "ENGAGED", "0", "✓ Response complete, awaiting user")
-    sm.advance_unit()
-    flow_table.add_row("4", "NEXT_UNIT", "ENGAGED", "1", "Moving to next topic")
-    sm.start_bot_response()
-    flow_table.add_row("5", "BOT_RESPONSE", "ENGAGED", "1", "🤔 Challenger: Asking critical question...")
-    
-    # INTERRUPTION!
-    sm.user_clicks_interrupt()
-    flow_table.add_row("[bold]6[/bold]", "[bold red]USER_INTERRUPT[/bold red]", "[bold red]INTERRUPTED[/bold red]", "[bold]1[/bold]", "[bold]🛑 User clicks [INTERRUPT] button![/bold]")
-    sm.process_interruption_message("Wait, I don't understand X")
-    flow_table.add_row("7", "USER_MESSAGE", "INTERRUPTED", "1", "User: 'I don't understand X'")
-    sm.start_bot_response()
-    flow_table.add_row("8", "BOT_RESPONSE", "INTERRUPTED", "1", "Bot clarifying confusion...")
-    sm.finish_bot_response()
-    flow_table.add_row("9", "BOT_RESPONSE", "INTERRUPTED", "1", "✓ Clarification provided")
-    
-    # RESUME
-    sm.resume_conversation()
-    flow_table.add_row("[bold]10[/bold]", "[bold green]RESUME[/bold green]", "[bold green]ENGAGED[/bold green]", "[bold]1[/bold]", "[bold]▶️  Resumed from where we left off[/bold]")
-    sm.finish_bot_response()
-    flow_table.add_row("11", "BOT_RESPONSE", "ENGAGED", "1", "Continuing main topic...")
-    sm.advance_unit()
-    flow_table.add_row("12", "NEXT_UNIT", "ENGAGED", "2", "Next unit: 📋 Summarizer")
-    
-    console.print(flow_table)
-    console.print()
-    
-    # State summary
-    summary = sm.get_state_summary()
-    status_panel = Panel(
-        f"""[bold]Current State Summary[/bold]
+HEADER_BANNER = """
 
-🔹 State:           [green]{summary['current_state'].upper()}[/green]
-🔹 Current Unit:    [cyan]{summary['progress']['current_unit']} / {summary['progress']['total_units']}[/cyan]
-🔹 Progress:        [yellow]{summary['progress']['percentage']:.1f}%[/yellow]
-🔹 Interruptions:   [red]{summary['interruptions']}[/red] (handled seamlessly)
-🔹 Bot Status:      [magenta]{'Generating' if summary['bot_status']['is_generating'] else 'Awaiting Input'}[/magenta]
-""",
-        title="State Machine Status",
-        border_style="magenta",
-        box=box.ROUNDED
-    )
-    console.print(status_panel)
-    console.print()
-    
-    # STAGE 4 - Test Results
-    console.print(Panel("[bold green]STAGE 4: VERIFICATION & QUALITY METRICS[/bold green]", border_style="green"))
-    
-    test_table = Table(title="✅ Test Suite Results", box=box.DOUBLE_EDGE)
-    test_table.add_column("Module", style="cyan", width=30)
-    test_table.add_column("Tests", justify="right", style="yellow")
-    test_table.add_column("Status", style="green", width=15)
-    
-    test_table.add_row("conversation_state.py", "19", "✅ PASS")
-    test_table.add_row("role_assignment.py", "20", "✅ PASS")
-    test_table.add_row("role_templates.py", "19", "✅ PASS")
-    test_table.add_row("document processing", "24", "✅ PASS")
-    test_table.add_row("[bold]TOTAL[/bold]", "[bold]82[/bold]", "[bold green]✅ ALL PASS[/bold green]")
-    console.print(test_table)
-    console.print()
-    
-    # Final summary
-    summary_panel = Panel(
-        """[bold cyan]PHASE 1: BACKEND MODULES COMPLETE[/bold cyan]
+╔═══════════════════════════════════════════════════════════════╗
+║   RQSM-ENGINE: Deterministic Multi-Role Learning Engine      ║
+║   Capstone Project - Progress Demonstration                  ║
+║   Phase 1 Complete: Core Backend | Tests: 82/82 Passing      ║
+╚═══════════════════════════════════════════════════════════════╝"""
+
+# Flattens line breaks and tabs in single-line text previews
+_NL_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
+# Stage 3 conversation script: (state machine method, args, event, state,
+# unit, action, emphasis). The first row is the START_DIALOGUE already
+# applied.
+FLOW_SCRIPT = [
+    (None, (), "START_DIALOGUE", "ENGAGED", 0, "💡 Explainer: Teaching first concept", False),
+    ("start_bot_response", (), "BOT_RESPONSE", "ENGAGED", 0, "Bot is generating response...", False),
+    ("finish_bot_response", (), "BOT_RESPONSE", "ENGAGED", 0, "✓ Response complete, awaiting user", False),
+    ("advance_unit", (), "NEXT_UNIT", "ENGAGED", 1, "Moving to next topic", False),
+    ("start_bot_response", (), "BOT_RESPONSE", "ENGAGED", 1, "🤔 Challenger: Asking critical question...", False),
+    ("user_clicks_interrupt", (), "[bold red]USER_INTERRUPT[/bold red]", "[bold red]INTERRUPTED[/bold red]",
+     1, "[bold]🛑 User clicks [INTERRUPT] button![/bold]", True),
+    ("process_interruption_message", ("Wait, I don't understand X",),
+     "USER_MESSAGE", "INTERRUPTED", 1, "User: 'I don't understand X'", False),
+    ("start_bot_response", (), "BOT_RESPONSE", "INTERRUPTED", 1, "Bot clarifying confusion...", False),
+    ("finish_bot_response", (), "BOT_RESPONSE", "INTERRUPTED", 1, "✓ Clarification provided", False),
+    ("resume_conversation", (), "[bold green]RESUME[/bold green]", "[bold green]ENGAGED[/bold green]",
+     1, "[bold]▶️  Resumed from where we left off[/bold]", True),
+    ("finish_bot_response", (), "BOT_RESPONSE", "ENGAGED", 1, "Continuing main topic...", False),
+    ("advance_unit", (), "NEXT_UNIT", "ENGAGED", 2, "Next unit: 📋 Summarizer", False),
+]
+
+ROLE_ICONS = {
+    RoleType.EXPLAINER: "💡",
+    RoleType.CHALLENGER: "🤔",
+    RoleType.SUMMARIZER: "📋",
+    RoleType.EXAMPLE_GENERATOR: "💼",
+    RoleType.MISCONCEPTION_SPOTTER: "⚠️"
+}
+
+# "<icon> <role>" labels, built once for all role tables
+ROLE_LABELS = {role: f"{ROLE_ICONS.get(role, '')} {role.value}" for role in RoleType}
+
+# Static Stage 4 renderables, built once at import
+TEST_RESULTS_TABLE = Table(title="✅ Test Suite Results", box=box.DOUBLE_EDGE)
+TEST_RESULTS_TABLE.add_column("Module", style="cyan", width=30)
+TEST_RESULTS_TABLE.add_column("Tests", justify="right", style="yellow")
+TEST_RESULTS_TABLE.add_column("Status", style="green", width=15)
+
+TEST_RESULTS_TABLE.add_row("conversation_state.py", "19", "✅ PASS")
+TEST_RESULTS_TABLE.add_row("role_assignment.py", "20", "✅ PASS")
+TEST_RESULTS_TABLE.add_row("role_templates.py", "19", "✅ PASS")
+TEST_RESULTS_TABLE.add_row("document processing", "24", "✅ PASS")
+TEST_RESULTS_TABLE.add_row("[bold]TOTAL[/bold]", "[bold]82[/bold]", "[bold green]✅ ALL PASS[/bold green]")
+
+SUMMARY_PANEL = Panel(
+    """[bold cyan]PHASE 1: BACKEND MODULES COMPLETE[/bold cyan]
 
 [bold green]✅ Completed Components:[/bold green]
 [green]✓[/green] Document Processing:  PDF/TXT → Headings → Semantic Units
@@ -213,16 +96,189 @@ def main():
 [bold white]Current Status: Phase 1 Complete (Backend Core)[/bold white]
 [dim]This demo shows the foundational modules working together[/dim]
 """,
-        title="Capstone Project Progress",
-        border_style="yellow",
-        box=box.DOUBLE
-    )
-    console.print(summary_panel)
+    title="Capstone Project Progress",
+    border_style="yellow",
+    box=box.DOUBLE
+)
+
+
+def main(fast: bool = False):
+    # Header (printed before the heavy imports so it shows immediately)
+    console.print(HEADER_BANNER, style="bold cyan", highlight=False)
     console.print()
+    
+    # DocumentProcessor and RoleAssigner pull in sentence-transformers/torch
+    from app.document.processor import DocumentProcessor
+    from app.document.segmenter import DEFAULT_EMBEDDING_CACHE_DIR
+    from app.roles.role_assignment import RoleAssigner
+    
+    # Rich buffers everything printed inside this block and writes it once
+    with console:
+        # STAGE 1
+        console.print(Panel("[bold green]STAGE 1: DOCUMENT PROCESSING[/bold green]", border_style="green"))
+        processor = DocumentProcessor(embedding_cache_dir=DEFAULT_EMBEDDING_CACHE_DIR)
+        semantic_units = processor.process_document("demo_document.txt")
+        doc_summary = processor.get_document_summary(semantic_units)
+        
+        # Document stats
+        stats_table = Table(box=box.ROUNDED, show_header=False)
+        stats_table.add_column("", style="cyan", width=25)
+        stats_table.add_column("", style="yellow")
+        stats_table.add_row("📄 Document", "demo_document.txt")
+        stats_table.add_row("📊 Semantic Units", f"{len(semantic_units)}")
+        stats_table.add_row("📝 Total Words", f"{doc_summary['total_words']}")
+        stats_table.add_row("🎯 Avg Cohesion", f"{doc_summary['avg_cohesion']:.3f}")
+        console.print(stats_table)
+        console.print()
+        
+        # Units preview
+        units_table = Table(title="Semantic Units", box=box.HEAVY, show_header=True)
+        units_table.add_column("ID", style="cyan", width=8)
+        units_table.add_column("Section", style="magenta", width=30)
+        units_table.add_column("Words", style="yellow", justify="right")
+        units_table.add_column("Preview", style="white", width=45)
+        
+        unit_rows = [
+            (
+                unit.id,
+                unit.title or "Body",
+                str(unit.word_count),
+                unit.text[:80].translate(_NL_TRANS) + "...",
+            )
+            for unit in semantic_units[:6]
+        ]
+        for row in unit_rows:
+            units_table.add_row(*row)
+        console.print(units_table)
+        console.print()
+        
+        # STAGE 2
+        console.print(Panel("[bold blue]STAGE 2: ROLE ASSIGNMENT[/bold blue]", border_style="blue"))
+        assigner = RoleAssigner()
+        assignments, stats = assigner.assign_roles_with_statistics(
+            semantic_units, balance_roles=True
+        )
+        
+        # Role distribution
+        role_table = Table(title="Role Distribution (Deterministic Scoring)", box=box.ROUNDED)
+        role_table.add_column("Role", style="cyan", width=28)
+        role_table.add_column("Count", justify="right", style="yellow")
+        role_table.add_column("%", justify="right", style="green")
+        role_table.add_column("Avg Score", justify="right", style="magenta")
+        
+        role_counts = stats['role_counts']
+        role_percentages = stats['role_percentages']
+        average_confidences = stats['average_confidences']
+        role_rows = [
+            (
+                ROLE_LABELS[role],
+                str(role_counts[role]),
+                f"{role_percentages[role]:.1f}%",
+                f"{average_confidences[role]:.3f}",
+            )
+            for role in RoleType
+        ]
+        for row in role_rows:
+            role_table.add_row(*row)
+        console.print(role_table)
+        console.print()
+        
+        # Sample assignments
+        assign_table = Table(title="Sample Assignments (Top 5)", box=box.DOUBLE)
+        assign_table.add_column("Unit", style="cyan")
+        assign_table.add_column("Role", style="magenta", width=28)
+        assign_table.add_column("Score", justify="right", style="green")
+        assign_table.add_column("Content", style="white", width=40)
+        
+        assign_rows = [
+            (
+                a.semantic_unit.id,
+                ROLE_LABELS[a.assigned_role],
+                f"{a.confidence:.3f}",
+                a.semantic_unit.text[:60].translate(_NL_TRANS) + "...",
+            )
+            for a in heapq.nlargest(5, assignments, key=lambda x: x.confidence)
+        ]
+        for row in assign_rows:
+            assign_table.add_row(*row)
+        console.print(assign_table)
+        console.print()
+        
+        # STAGE 3
+        console.print(Panel("[bold magenta]STAGE 3: STATE MACHINE (Interruption Flow)[/bold magenta]", border_style="magenta"))
+        sm = ConversationStateMachine(session_id="demo")
+        sm.transition(EventType.INITIALIZE)
+        sm.transition(EventType.DOCUMENT_LOADED, {'total_units': len(assignments)})
+        sm.context.total_units = len(assignments)
+        sm.transition(EventType.ROLES_ASSIGNED)
+        sm.transition(EventType.START_DIALOGUE)
+        
+        # Conversation flow (--fast prints plain lines instead of a table)
+        flow_rows = []
+        for step, (method, args, event, state, unit, action, emphasis) in enumerate(FLOW_SCRIPT, 1):
+            if method:
+                getattr(sm, method)(*args)
+            step_cell, unit_cell = str(step), str(unit)
+            if emphasis:
+                step_cell, unit_cell = f"[bold]{step_cell}[/bold]", f"[bold]{unit_cell}[/bold]"
+            flow_rows.append((step_cell, event, state, unit_cell, action))
+        
+        if fast:
+            console.print("Conversation Flow with Interruption", style="italic")
+            console.print("\n".join(" | ".join(row) for row in flow_rows), highlight=False)
+        else:
+            flow_table = Table(title="Conversation Flow with Interruption", box=box.HEAVY)
+            flow_table.add_column("Step", style="cyan", width=5)
+            flow_table.add_column("Event", style="yellow", width=22)
+            flow_table.add_column("State", style="green", width=15)
+            flow_table.add_column("Unit", style="magenta", width=5)
+            flow_table.add_column("Action", style="white", width=45)
+            
+            for row in flow_rows:
+                flow_table.add_row(*row)
+            
+            console.print(flow_table)
+        console.print()
+        
+        # State summary
+        summary = sm.get_state_summary()
+        status_panel = Panel(
+            f"""[bold]Current State Summary[/bold]
+
+🔹 State:           [green]{summary['current_state'].upper()}[/green]
+🔹 Current Unit:    [cyan]{summary['progress']['current_unit']} / {summary['progress']['total_units']}[/cyan]
+🔹 Progress:        [yellow]{summary['progress']['percentage']:.1f}%[/yellow]
+🔹 Interruptions:   [red]{summary['interruptions']}[/red] (handled seamlessly)
+🔹 Bot Status:      [magenta]{'Generating' if summary['bot_status']['is_generating'] else 'Awaiting Input'}[/magenta]
+""",
+            title="State Machine Status",
+            border_style="magenta",
+            box=box.ROUNDED
+        )
+        console.print(status_panel)
+        console.print()
+        
+        # STAGE 4 - Test Results
+        console.print(Panel("[bold green]STAGE 4: VERIFICATION & QUALITY METRICS[/bold green]", border_style="green"))
+        
+        console.print(TEST_RESULTS_TABLE)
+        console.print()
+        
+        # Final summary
+        console.print(SUMMARY_PANEL)
+        console.print()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RQSM-Engine auto-run demo")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="print the conversation flow as plain lines instead of a boxed table"
+    )
+    args = parser.parse_args()
+    
     try:
-        main()
+        main(fast=args.fast)
     except Exception as e:
         console.print(f"\n[red]Error: {e}[/red]")
         import traceback
@@ -28,11 +28,7 @@ def test_interruption_flow():
     sm = ConversationStateMachine(session_id="test")
     
     # Setup to ENGAGED
-    sm.transition(EventType.INITIALIZE)
-    sm.transition(EventType.DOCUMENT_LOADED)
-    sm.context.total_units = 3
-    sm.transition(EventType.ROLES_ASSIGNED)
-    sm.transition(EventType.START_DIALOGUE)
+    sm.fast_init_engaged(total_units=3)
     
     # Bot starts responding
     sm.start_bot_response()
@@ -62,11 +58,7 @@ def test_advance_unit():
     sm = ConversationStateMachine(session_id="test")
     
     # Setup
-    sm.transition(EventType.INITIALIZE)
-    sm.transition(EventType.DOCUMENT_LOADED)
-    sm.context.total_units = 3
-    sm.transition(EventType.ROLES_ASSIGNED)
-    sm.transition(EventType.START_DIALOGUE)
+    sm.fast_init_engaged(total_units=3)
     
     assert sm.context.current_unit_index == 0
     
@@ -92,11 +84,7 @@ def test_persistence():
     sm = ConversationStateMachine(session_id="test_123")
     
     # Setup some state
-    sm.transition(EventType.INITIALIZE)
-    sm.transition(EventType.DOCUMENT_LOADED)
-    sm.context.total_units = 5
-    sm.transition(EventType.ROLES_ASSIGNED)
-    sm.transition(EventType.START_DIALOGUE)
+    sm.fast_init_engaged(total_units=5)
     
     # Advance a few units
     sm.advance_unit()
@@ -126,11 +114,7 @@ def test_ui_indicators():
     sm = ConversationStateMachine(session_id="test")
     
     # Setup
-    sm.transition(EventType.INITIALIZE)
-    sm.transition(EventType.DOCUMENT_LOADED)
-    sm.context.total_units = 3
-    sm.transition(EventType.ROLES_ASSIGNED)
-    sm.transition(EventType.START_DIALOGUE)
+    sm.fast_init_engaged(total_units=3)
     
     # Bot starts generating
     sm.start_bot_response()
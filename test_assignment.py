@@ -3,12 +3,21 @@ Demo script for Role Assignment Engine
 Shows end-to-end document processing with role assignment
 """
 from app.document.processor import DocumentProcessor
+from app.document.segmenter import DEFAULT_EMBEDDING_CACHE_DIR
 from app.roles.role_assignment import RoleAssigner
+from app.roles.role_templates import RoleType, role_library
 from pathlib import Path
 
 
+# Distribution bars for 0..50 cells (100% maps to 50)
+_BARS = tuple("█" * i for i in range(51))
+
+
 def demo_role_assignment():
     """Demonstrate role assignment on sample document"""
+    # Role icons looked up once instead of per printed row
+    icons = {r: role_library.get_role(r).metadata.get('icon', '') for r in RoleType}
+    
     print("=" * 80)
     print("RQSM-Engine Role Assignment Demo")
     print("=" * 80)
@@ -25,7 +34,7 @@ def demo_role_assignment():
     print()
     
     # Initialize processor
-    processor = DocumentProcessor()
+    processor = DocumentProcessor(embedding_cache_dir=DEFAULT_EMBEDDING_CACHE_DIR)
     
     # Process document
     semantic_units = processor.process_document(str(doc_path))
@@ -38,7 +47,9 @@ def demo_role_assignment():
     
     # Assign roles with balancing
     print("Assigning roles (with balancing)...")
-    assignments = assigner.assign_roles(semantic_units, balance_roles=True)
+    assignments, stats = assigner.assign_roles_with_statistics(
+        semantic_units, balance_roles=True
+    )
     print(f"✓ Assigned roles to {len(assignments)} units")
     print()
     
@@ -50,7 +61,7 @@ def demo_role_assignment():
     
     for i, assignment in enumerate(assignments[:5], 1):
         unit = assignment.semantic_unit
-        role_icon = assignment.role_template.metadata.get('icon', '')
+        role_icon = icons[assignment.assigned_role]
         
         print(f"{i}. Unit {unit.id} → {assignment.assigned_role.value} {role_icon}")
         print(f"   Title: {unit.title or '(no title)'}")
@@ -77,12 +88,7 @@ def demo_role_assignment():
     queue = assigner.get_role_queue(assignments)
     
     for i, (role, unit) in enumerate(queue[:10], 1):
-        role_template = assigner.scorer.scorer if hasattr(assigner.scorer, 'scorer') else None
-        from app.roles.role_templates import role_library
-        template = role_library.get_role(role)
-        icon = template.metadata.get('icon', '')
-        
-        print(f"{i:2d}. {role.value:25s} {icon} → Unit {unit.id} ({unit.document_section})")
+        print(f"{i:2d}. {role.value:25s} {icons[role]} → Unit {unit.id} ({unit.document_section})")
     
     if len(queue) > 10:
         print(f"     ... and {len(queue) - 10} more in queue")
@@ -94,23 +100,21 @@ def demo_role_assignment():
     print("=" * 80)
     print()
     
-    stats = assigner.get_statistics(assignments)
-    
     print(f"Total Assignments: {stats['total_assignments']}")
     print(f"Overall Confidence: {stats['overall_confidence']:.2f}")
     print()
     
     print("Role Distribution:")
-    from app.roles.role_templates import role_library
-    
-    for role_type, count in stats['role_counts'].items():
-        template = role_library.get_role(role_type)
-        icon = template.metadata.get('icon', '')
-        percentage = stats['role_percentages'][role_type]
-        avg_conf = stats['average_confidences'][role_type]
-        
+    role_percentages = stats['role_percentages']
+    average_confidences = stats['average_confidences']
+    distribution_rows = [
+        (role_type, count, role_percentages[role_type], average_confidences[role_type], icons[role_type])
+        for role_type, count in stats['role_counts'].items()
+    ]
+    
+    for role_type, count, percentage, avg_conf, icon in distribution_rows:
         bar_length = int(percentage / 2)  # Scale to 50 chars max
-        bar = "█" * bar_length
+        bar = _BARS[min(bar_length, 50)]
         
         print(f"{role_type.value:25s} {icon}: {count:2d} ({percentage:5.1f}%) {bar}")
         print(f"{'':27s}    Avg Confidence: {avg_conf:.2f}")
@@ -124,15 +128,16 @@ def demo_role_assignment():
     print("=" * 80)
     print()
     
-    greedy_assignments = assigner.assign_roles(semantic_units, balance_roles=False)
-    greedy_stats = assigner.get_statistics(greedy_assignments)
+    greedy_assignments, greedy_stats = assigner.assign_roles_with_statistics(
+        semantic_units, balance_roles=False
+    )
     
     print(f"{'Role':<25s} {'Greedy':<12s} {'Balanced':<12s} {'Difference'}")
     print("-" * 80)
     
-    for role_type in stats['role_counts'].keys():
-        greedy_pct = greedy_stats['role_percentages'][role_type]
-        balanced_pct = stats['role_percentages'][role_type]
+    greedy_percentages = greedy_stats['role_percentages']
+    for role_type, balanced_pct in role_percentages.items():
+        greedy_pct = greedy_percentages[role_type]
         diff = balanced_pct - greedy_pct
         
         print(f"{role_type.value:<25s} {greedy_pct:5.1f}%       {balanced_pct:5.1f}%       {diff:+5.1f}%")
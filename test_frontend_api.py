@@ -5,6 +5,45 @@ Shows clean API for UI integration with explicit interrupt button
 from app.state_machine.conversation_state import ConversationStateMachine, EventType
 
 
+# Static display_ui_state() blocks, built once
+UI_SEPARATOR = "=" * 60
+UI_STATE_HEADER = f"\n{UI_SEPARATOR}\nUI STATE\n{UI_SEPARATOR}"
+UI_ELEMENTS_GENERATING = (
+    "  ⏳ Typing indicator: VISIBLE\n"
+    "  📝 Input box: DISABLED\n"
+    "  🛑 [INTERRUPT] button: ENABLED (red, pulsing)"
+)
+UI_ELEMENTS_AWAITING_INPUT = (
+    "  ⏳ Typing indicator: HIDDEN\n"
+    "  📝 Input box: ENABLED\n"
+    "  🛑 [INTERRUPT] button: ENABLED"
+)
+
+# display_ui_state() flag bits
+UI_GENERATING = 1
+UI_AWAITING_INPUT = 2
+UI_CAN_RESUME = 4
+UI_COMPLETE = 8
+
+
+def _build_ui_elements(flags: int) -> str:
+    """Render the "UI Elements" block for one flag combination"""
+    lines = ["\nUI Elements:"]
+    if flags & UI_GENERATING:
+        lines.append(UI_ELEMENTS_GENERATING)
+    elif flags & UI_AWAITING_INPUT:
+        lines.append(UI_ELEMENTS_AWAITING_INPUT)
+    if flags & UI_CAN_RESUME:
+        lines.append("  ▶️  [RESUME] buttons: VISIBLE")
+    if flags & UI_COMPLETE:
+        lines.append("  ✅ Completion screen: SHOW")
+    return "\n".join(lines)
+
+
+# Every flag combination pre-rendered; indexed by the bitmask
+UI_ELEMENTS_TABLE = tuple(_build_ui_elements(flags) for flags in range(16))
+
+
 def simulate_bot_thinking(message: str):
     """Simulate bot generating response"""
     print(f"\n🤖 Bot: {message}")
@@ -13,30 +52,22 @@ def simulate_bot_thinking(message: str):
 def display_ui_state(sm: ConversationStateMachine):
     """Show what UI elements should be visible"""
     summary = sm.get_state_summary()
+    progress = summary['progress']
+    bot_status = summary['bot_status']
     
-    print(f"\n{'='*60}")
-    print(f"UI STATE")
-    print(f"{'='*60}")
+    print(UI_STATE_HEADER)
     print(f"Conversation: {summary['current_state'].upper()}")
-    print(f"Progress: Unit {summary['progress']['current_unit'] + 1}/{summary['progress']['total_units']} "
-          f"({summary['progress']['percentage']:.0f}%)")
+    print(f"Progress: Unit {progress['current_unit'] + 1}/{progress['total_units']} "
+          f"({progress['percentage']:.0f}%)")
     
     # UI element visibility
-    print(f"\nUI Elements:")
-    if summary['bot_status']['is_generating']:
-        print(f"  ⏳ Typing indicator: VISIBLE")
-        print(f"  📝 Input box: DISABLED")
-        print(f"  🛑 [INTERRUPT] button: ENABLED (red, pulsing)")
-    elif summary['bot_status']['awaiting_input']:
-        print(f"  ⏳ Typing indicator: HIDDEN")
-        print(f"  📝 Input box: ENABLED")
-        print(f"  🛑 [INTERRUPT] button: ENABLED")
-    
-    if summary['can_resume']:
-        print(f"  ▶️  [RESUME] buttons: VISIBLE")
-    
-    if summary['is_complete']:
-        print(f"  ✅ Completion screen: SHOW")
+    flags = (
+        (UI_GENERATING if bot_status['is_generating'] else 0)
+        | (UI_AWAITING_INPUT if bot_status['awaiting_input'] else 0)
+        | (UI_CAN_RESUME if summary['can_resume'] else 0)
+        | (UI_COMPLETE if summary['is_complete'] else 0)
+    )
+    print(UI_ELEMENTS_TABLE[flags])
     
     print(f"\nStats: {summary['messages']} messages, {summary['interruptions']} interruptions")
 
@@ -2,7 +2,7 @@
 Integration test for complete document processing pipeline
 """
 from app.document.processor import DocumentProcessor
-from pathlib import Path
+from app.document.segmenter import DEFAULT_EMBEDDING_CACHE_DIR
 
 
 def test_process_sample_document():
@@ -11,21 +11,23 @@ def test_process_sample_document():
     # Initialize processor
     processor = DocumentProcessor(
         embedding_model='all-MiniLM-L6-v2',
-        similarity_threshold=0.75
+        similarity_threshold=0.75,
+        embedding_cache_dir=DEFAULT_EMBEDDING_CACHE_DIR
     )
     
     # Process document
     sample_path = "sample_docs/machine_learning_intro.txt"
     
-    if not Path(sample_path).exists():
-        print(f"Sample document not found: {sample_path}")
-        return
-    
     print(f"\n{'='*60}")
     print(f"Processing: {sample_path}")
     print(f"{'='*60}\n")
     
-    semantic_units = processor.process_document(sample_path)
+    # The loader checks for the file itself; no separate exists() probe
+    try:
+        semantic_units = processor.process_document(sample_path)
+    except FileNotFoundError:
+        print(f"Sample document not found: {sample_path}")
+        return
     
     # Display results
     print(f"✓ Successfully processed document")
@@ -4,8 +4,12 @@ Pytest Configuration and Fixtures
 import pytest
 from pathlib import Path
 
+from app.document.heading_detector import HeadingDetector
+from app.document.loader import DocumentLoader
+from app.state_machine.conversation_state import ConversationStateMachine, EventType
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_text_document():
     """Sample text document for testing"""
     return """INTRODUCTION
@@ -46,10 +50,10 @@ def sample_pdf_path():
     return Path("sample_docs/test_document.pdf")
 
 
-@pytest.fixture
-def sample_txt_path(tmp_path):
-    """Create a temporary text file for testing"""
-    filepath = tmp_path / "test_document.txt"
+@pytest.fixture(scope="session")
+def sample_txt_path(tmp_path_factory):
+    """Create a temporary text file for testing (read-only, shared per session)"""
+    filepath = tmp_path_factory.mktemp("docs") / "test_document.txt"
     filepath.write_text("""INTRODUCTION
 
 This is a test document for unit testing.
@@ -64,3 +68,29 @@ Main content goes here.""", encoding='utf-8')
 def temp_dir(tmp_path):
     """Temporary directory for test files"""
     return tmp_path
+
+
+@pytest.fixture(scope="session")
+def heading_detector():
+    """Shared HeadingDetector (tests don't mutate it)"""
+    return HeadingDetector()
+
+
+@pytest.fixture(scope="session")
+def document_loader():
+    """Shared DocumentLoader (stateless)"""
+    return DocumentLoader()
+
+
+@pytest.fixture
+def engaged_sm():
+    """Factory for a state machine taken through the setup flow to ENGAGED"""
+    def _make(total_units=0, session_id=None):
+        sm = ConversationStateMachine(session_id=session_id)
+        sm.transition(EventType.INITIALIZE)
+        sm.transition(EventType.DOCUMENT_LOADED)
+        sm.context.total_units = total_units
+        sm.transition(EventType.ROLES_ASSIGNED)
+        sm.transition(EventType.START_DIALOGUE)
+        return sm
+    return _make
@@ -1,6 +1,7 @@
 """Unit tests for in-memory conversation runtime."""
 import io
 
+import pytest
 from fastapi import UploadFile
 
 from app.document.segmenter import SemanticUnit
@@ -19,6 +20,9 @@ class DummyProcessor:
     def process_document(self, _path):
         return self._units
 
+    def get_document_summary(self, semantic_units):
+        return {"total_units": len(semantic_units)}
+
 
 class DummyAssigner:
     """Simple fake assigner for runtime tests."""
@@ -26,10 +30,35 @@ class DummyAssigner:
     def __init__(self, assignments):
         self._assignments = assignments
 
-    def assign_roles(self, _semantic_units, balance_roles=True):
+    def assign_roles(self, _semantic_units, balance_roles=True, allowed_roles=None):
         return self._assignments
 
 
+class InterruptingClient:
+    """Fake LLM client; the user interrupts during the Nth generate call."""
+
+    def __init__(self, runtime, session_id, interrupt_on_call):
+        self._runtime = runtime
+        self._session_id = session_id
+        self._interrupt_on_call = interrupt_on_call
+        self.calls = 0
+
+    def generate(self, prompt, temperature=None, max_tokens=None, cancel_token=None):
+        self.calls += 1
+        if self.calls == self._interrupt_on_call:
+            self._runtime.interrupt(self._session_id)
+            cancel_token.raise_if_cancelled()
+        return "Models learn patterns from data."
+
+
+class CancellingClient:
+    """Fake LLM client whose generation is cancelled while it is in flight."""
+
+    def generate(self, prompt, temperature=None, max_tokens=None, cancel_token=None):
+        cancel_token.set()
+        cancel_token.raise_if_cancelled()
+
+
 def _make_unit(position: int, text: str) -> SemanticUnit:
     return SemanticUnit(
         id=f"S0_{position}",
@@ -123,3 +152,62 @@ def test_runtime_missing_session_raises_keyerror():
         assert False, "Expected KeyError"
     except KeyError:
         assert True
+
+
+@pytest.mark.parametrize("interrupt_on_call", [1, 2])
+def test_runtime_interrupt_stops_group_opener(monkeypatch, interrupt_on_call):
+    """An interrupt mid-opener stops the remaining speakers and drops the cancelled turn."""
+    unit0 = _make_unit(0, "Machine learning models learn patterns from data.")
+    assignment = _make_assignment(unit0, RoleType.EXPLAINER)
+    assignment.chime_in_roles = [RoleType.CHALLENGER, RoleType.SUMMARIZER]
+
+    runtime = ConversationRuntime()
+    monkeypatch.setattr(runtime, "_get_processor", lambda: DummyProcessor([unit0]))
+    monkeypatch.setattr(runtime, "_get_assigner", lambda: DummyAssigner([assignment]))
+
+    upload = UploadFile(filename="doc.txt", file=io.BytesIO(b"hello"))
+    session = runtime.create_session_from_uploaded_file(upload)
+    client = InterruptingClient(runtime, session.session_id, interrupt_on_call)
+    runtime._llm_client = client
+
+    start = runtime.start_conversation(session.session_id)
+    sm = session.state_machine
+    finished_turns = interrupt_on_call - 1
+
+    assert client.calls == interrupt_on_call
+    assert len(start["messages"]) == finished_turns
+    assert all(m["text"] for m in start["messages"])
+    assert all(m["text"] for m in session.conversation_history)
+    assert start["state"]["current_state"] == "interrupted"
+    assert sm.context.message_count == (1 if finished_turns else 0)
+    assert sm.context.awaiting_user_input is True
+
+
+def test_runtime_cancelled_interruption_answer(monkeypatch):
+    """A cancelled interruption answer returns no messages and releases the input."""
+    unit0 = _make_unit(0, "Machine learning models learn patterns from data.")
+    assignment = _make_assignment(unit0, RoleType.EXPLAINER)
+
+    runtime = ConversationRuntime()
+    runtime._llm_available = False
+    monkeypatch.setattr(runtime, "_get_processor", lambda: DummyProcessor([unit0]))
+    monkeypatch.setattr(runtime, "_get_assigner", lambda: DummyAssigner([assignment]))
+
+    upload = UploadFile(filename="doc.txt", file=io.BytesIO(b"hello"))
+    session = runtime.create_session_from_uploaded_file(upload)
+    runtime.start_conversation(session.session_id)
+    runtime.interrupt(session.session_id)
+    sm = session.state_machine
+    messages_before = sm.context.message_count
+    history_before = list(session.conversation_history)
+
+    runtime._llm_available = True
+    runtime._llm_client = CancellingClient()
+    answer = runtime.answer_interruption(session.session_id, "what is a model?")
+
+    assert answer["messages"] == []
+    assert answer["response"] == ""
+    assert answer["state"]["current_state"] == "interrupted"
+    assert sm.context.message_count == messages_before
+    assert sm.context.bot_is_generating is False
+    assert session.conversation_history == history_before
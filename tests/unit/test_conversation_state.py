@@ -11,6 +11,7 @@ from app.state_machine.conversation_state import (
     ConversationContext,
     ConversationStateMachine
 )
+from app.llm.cancellation import GenerationCancelled
 
 
 class TestConversationState:
@@ -110,6 +111,14 @@ class TestConversationContext:
         assert ctx2.current_unit_index == 3
         assert ctx2.current_state == ConversationState.ENGAGED
         assert ctx2.bot_is_generating == True
+    
+    def test_context_deserialization_unknown_state(self):
+        """Test from_dict rejects an unknown state value with ValueError"""
+        data = ConversationContext().to_dict()
+        data['current_state'] = "dormant"
+        
+        with pytest.raises(ValueError, match="'dormant' is not a valid ConversationState"):
+            ConversationContext.from_dict(data)
 
 
 class TestConversationStateMachine:
@@ -147,16 +156,19 @@ class TestConversationStateMachine:
         with pytest.raises(ValueError):
             sm.transition(EventType.USER_INTERRUPT)  # Can't interrupt from IDLE
     
-    def test_interruption_flow(self):
-        """Test interruption flow"""
+    def test_direct_state_assignment_is_validated(self):
+        """Test transitions validate against context.current_state as assigned"""
         sm = ConversationStateMachine()
+        sm.context.current_state = ConversationState.ENGAGED
         
-        # Setup to ENGAGED
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.context.total_units = 3
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        assert sm.can_transition(EventType.USER_INTERRUPT)
+        assert not sm.can_transition(EventType.INITIALIZE)
+        sm.transition(EventType.USER_INTERRUPT)
+        assert sm.get_state_summary()['current_state'] == 'interrupted'
+    
+    def test_interruption_flow(self, engaged_sm):
+        """Test interruption flow"""
+        sm = engaged_sm(3)
         
         # User interrupts
         result = sm.user_clicks_interrupt()
@@ -173,16 +185,9 @@ class TestConversationStateMachine:
         assert result['success'] == True
         assert sm.context.current_state == ConversationState.ENGAGED
     
-    def test_advance_unit(self):
+    def test_advance_unit(self, engaged_sm):
         """Test unit advancement"""
-        sm = ConversationStateMachine()
-        
-        # Setup
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.context.total_units = 3
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        sm = engaged_sm(3)
         
         assert sm.context.current_unit_index == 0
         
@@ -200,14 +205,53 @@ class TestConversationStateMachine:
         assert result['completed'] == True
         assert sm.context.current_state == ConversationState.COMPLETED
     
-    def test_bot_response_lifecycle(self):
-        """Test bot response start/finish"""
+    def test_state_history_skips_hot_events(self, engaged_sm):
+        """Test bot/unit events are not recorded in history, user messages are"""
+        sm = engaged_sm(3)
+        sm.process_user_message("hello")
+        sm.transition(EventType.BOT_RESPONSE)
+        sm.advance_unit()
+        sm.user_clicks_interrupt()
+        
+        events = [t.event for t in sm.context.state_history]
+        assert events == [
+            EventType.INITIALIZE,
+            EventType.DOCUMENT_LOADED,
+            EventType.ROLES_ASSIGNED,
+            EventType.START_DIALOGUE,
+            EventType.USER_MESSAGE,
+            EventType.USER_INTERRUPT,
+        ]
+        # The user's text is only kept in the USER_MESSAGE record
+        assert sm.context.state_history[4].metadata == {'message': 'hello'}
+    
+    def test_fast_init_engaged(self):
+        """Test one-step setup matches the individual setup transitions"""
         sm = ConversationStateMachine()
+        sm.fast_init_engaged(total_units=3)
         
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        ref = ConversationStateMachine()
+        ref.transition(EventType.INITIALIZE)
+        ref.transition(EventType.DOCUMENT_LOADED)
+        ref.context.total_units = 3
+        ref.transition(EventType.ROLES_ASSIGNED)
+        ref.transition(EventType.START_DIALOGUE)
+        
+        assert sm.context.current_state == ConversationState.ENGAGED
+        assert sm.context.total_units == 3
+        assert sm.context.current_unit_index == 0
+        assert sm.context.started_at is not None
+        assert sm.get_state_summary() == ref.get_state_summary()
+        assert ([(t.from_state, t.event, t.to_state, dict(t.metadata)) for t in sm.context.state_history] ==
+                [(t.from_state, t.event, t.to_state, dict(t.metadata)) for t in ref.context.state_history])
+        
+        # Only valid from IDLE
+        with pytest.raises(ValueError):
+            sm.fast_init_engaged(total_units=3)
+    
+    def test_bot_response_lifecycle(self, engaged_sm):
+        """Test bot response start/finish"""
+        sm = engaged_sm()
         
         # Start generating
         sm.start_bot_response()
@@ -220,15 +264,39 @@ class TestConversationStateMachine:
         assert sm.context.awaiting_user_input == True
         assert sm.context.message_count == 1
     
-    def test_state_summary(self):
-        """Test get_state_summary"""
+    def test_bot_response_fast_path(self, engaged_sm):
+        """Test single-call bot response"""
+        sm = engaged_sm()
+        
+        sm.bot_response()
+        assert sm.context.bot_is_generating == False
+        assert sm.context.awaiting_user_input == True
+        assert sm.context.message_count == 1
+        
+        sm.bot_response(message_count_delta=3)
+        assert sm.context.message_count == 4
+    
+    def test_interrupt_cancels_bot_response(self):
+        """Test interrupt sets the in-flight response's cancellation token"""
         sm = ConversationStateMachine()
+        sm.fast_init_engaged(total_units=3)
         
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.context.total_units = 5
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        token = sm.start_bot_response()
+        assert token is sm.cancel_token
+        assert not token.is_cancelled
+        
+        sm.user_clicks_interrupt()
+        assert token.is_cancelled
+        with pytest.raises(GenerationCancelled):
+            token.raise_if_cancelled()
+        
+        # Next response gets a fresh token
+        sm.process_interruption_message("why?")
+        assert not sm.start_bot_response().is_cancelled
+    
+    def test_state_summary(self, engaged_sm):
+        """Test get_state_summary"""
+        sm = engaged_sm(5)
         
         summary = sm.get_state_summary()
         
@@ -239,16 +307,39 @@ class TestConversationStateMachine:
         assert summary['can_interrupt'] == True
         assert summary['is_complete'] == False
     
-    def test_persistence(self):
-        """Test save and load state"""
-        sm = ConversationStateMachine(session_id="persist_test")
+    def test_state_summary_cache(self, engaged_sm):
+        """Test get_state_summary stays current while its cache is reused"""
+        sm = engaged_sm(4)
         
-        # Setup state
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.context.total_units = 10
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        first = sm.get_state_summary()
+        assert sm.get_state_summary() == first
+        
+        # Direct context writes are picked up too
+        sm.context.current_role = "Explainer"
+        summary = sm.get_state_summary()
+        assert summary != first
+        assert summary['current_role'] == "Explainer"
+        
+        sm.advance_unit()
+        summary = sm.get_state_summary()
+        assert summary['progress']['current_unit'] == 1
+        assert summary['progress']['percentage'] == 25
+    
+    def test_state_summary_mutation_does_not_leak(self, engaged_sm):
+        """Test mutating a returned summary leaves later calls unchanged"""
+        sm = engaged_sm(4)
+        
+        expected = sm.get_state_summary()
+        summary = sm.get_state_summary()
+        summary['current_state'] = 'completed'
+        summary['progress']['current_unit'] = 3
+        summary['bot_status']['is_generating'] = True
+        
+        assert sm.get_state_summary() == expected
+    
+    def test_persistence(self, engaged_sm):
+        """Test save and load state"""
+        sm = engaged_sm(10, session_id="persist_test")
         sm.advance_unit()
         sm.advance_unit()
         
@@ -266,16 +357,26 @@ class TestConversationStateMachine:
         assert sm2.context.total_units == 10
         assert sm2.context.current_state == ConversationState.ENGAGED
     
-    def test_multiple_interruptions(self):
-        """Test multiple interruptions"""
-        sm = ConversationStateMachine()
+    def test_persistence_bytes(self, engaged_sm):
+        """Test binary save and load state"""
+        sm = engaged_sm(4, session_id="bytes_test")
+        sm.advance_unit()
         
-        # Setup
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.context.total_units = 5
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        blob = sm.save_state_bytes()
+        assert isinstance(blob, bytes)
+        
+        sm2 = ConversationStateMachine()
+        sm2.load_state_bytes(blob)
+        
+        assert sm2.context.session_id == "bytes_test"
+        assert sm2.context.current_unit_index == 1
+        assert sm2.context.total_units == 4
+        assert sm2.context.current_state == ConversationState.ENGAGED
+        assert sm2.context.started_at == sm.context.started_at
+    
+    def test_multiple_interruptions(self, engaged_sm):
+        """Test multiple interruptions"""
+        sm = engaged_sm(5)
         
         # First interruption
         sm.user_clicks_interrupt()
@@ -289,19 +390,12 @@ class TestConversationStateMachine:
         
         assert sm.context.current_state == ConversationState.ENGAGED
     
-    def test_bot_response_during_interruption_no_double_count(self):
+    def test_bot_response_during_interruption_no_double_count(self, engaged_sm):
         """
         Regression test for Bug #1: Bot responding DURING interruption 
         should not double-count interruption or change interrupted_at_index.
         """
-        sm = ConversationStateMachine()
-        
-        # Setup
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.context.total_units = 5
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        sm = engaged_sm(5)
         
         # User interrupts at unit 0
         result = sm.user_clicks_interrupt()
@@ -346,15 +440,9 @@ class TestConversationStateMachine:
         # Verify we returned to correct unit
         assert sm.context.current_unit_index == original_interrupted_at
     
-    def test_pause_unpause(self):
+    def test_pause_unpause(self, engaged_sm):
         """Test pause and unpause"""
-        sm = ConversationStateMachine()
-        
-        # Setup
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        sm = engaged_sm()
         
         # Pause
         sm.transition(EventType.PAUSE)
@@ -364,15 +452,9 @@ class TestConversationStateMachine:
         sm.transition(EventType.UNPAUSE)
         assert sm.context.current_state == ConversationState.ENGAGED
     
-    def test_reset(self):
+    def test_reset(self, engaged_sm):
         """Test reset functionality"""
-        sm = ConversationStateMachine()
-        
-        # Setup state
-        sm.transition(EventType.INITIALIZE)
-        sm.transition(EventType.DOCUMENT_LOADED)
-        sm.transition(EventType.ROLES_ASSIGNED)
-        sm.transition(EventType.START_DIALOGUE)
+        sm = engaged_sm()
         
         # Reset
         sm.reset()
@@ -14,9 +14,8 @@ class TestHeadingDetector:
         detector = HeadingDetector()
         assert detector is not None
     
-    def test_detect_all_caps_headings(self):
+    def test_detect_all_caps_headings(self, heading_detector):
         """Test detection of ALL CAPS headings"""
-        detector = HeadingDetector()
         text = """INTRODUCTION TO TESTING
 
 This is some content under the heading.
@@ -25,7 +24,7 @@ METHODS AND PROCEDURES
 
 More content here."""
         
-        headings = detector.detect_headings(text)
+        headings = heading_detector.detect_headings(text)
         
         assert len(headings) == 2
         assert headings[0].text == "INTRODUCTION TO TESTING"
@@ -33,9 +32,8 @@ More content here."""
         assert headings[1].text == "METHODS AND PROCEDURES"
         assert headings[1].level == 1
     
-    def test_detect_numbered_headings(self):
+    def test_detect_numbered_headings(self, heading_detector):
         """Test detection of numbered headings"""
-        detector = HeadingDetector()
         text = """1. Introduction
 
 Some content here.
@@ -48,7 +46,7 @@ More content.
 
 Final section."""
         
-        headings = detector.detect_headings(text)
+        headings = heading_detector.detect_headings(text)
         
         # Should detect at least 2 headings (1. and 2.)
         assert len(headings) >= 2
@@ -60,9 +58,8 @@ Final section."""
         methods = next(h for h in headings if "Methods" in h.text)
         assert methods.level == 1
     
-    def test_detect_underlined_headings(self):
+    def test_detect_underlined_headings(self, heading_detector):
         """Test detection of underlined headings"""
-        detector = HeadingDetector()
         text = """Introduction
 ============
 
@@ -73,7 +70,7 @@ Methods
 
 More content."""
         
-        headings = detector.detect_headings(text)
+        headings = heading_detector.detect_headings(text)
         
         assert len(headings) == 2
         assert headings[0].text == "Introduction"
@@ -81,18 +78,16 @@ More content."""
         assert headings[1].text == "Methods"
         assert headings[1].level == 2
     
-    def test_no_headings(self):
+    def test_no_headings(self, heading_detector):
         """Test document with no headings"""
-        detector = HeadingDetector()
         text = """This is a simple document with no headings.
 Just plain paragraphs of text throughout."""
         
-        headings = detector.detect_headings(text)
+        headings = heading_detector.detect_headings(text)
         assert len(headings) == 0
     
-    def test_split_by_headings(self):
+    def test_split_by_headings(self, heading_detector):
         """Test splitting document into sections"""
-        detector = HeadingDetector()
         text = """INTRODUCTION AND OVERVIEW
 
 This is the introduction.
@@ -101,8 +96,8 @@ METHODS AND PROCEDURES
 
 This is the methods section."""
         
-        headings = detector.detect_headings(text)
-        sections = detector.split_by_headings(text, headings)
+        headings = heading_detector.detect_headings(text)
+        sections = heading_detector.split_by_headings(text, headings)
         
         assert len(sections) == 2
         assert sections[0]['title'] == "INTRODUCTION AND OVERVIEW"
@@ -110,45 +105,30 @@ This is the methods section."""
         assert sections[1]['title'] == "METHODS AND PROCEDURES"
         assert "methods" in sections[1]['text'].lower()
     
-    def test_split_no_headings(self):
+    def test_split_no_headings(self, heading_detector):
         """Test splitting document with no headings"""
-        detector = HeadingDetector()
         text = "Just plain text without headings."
         
-        headings = detector.detect_headings(text)
-        sections = detector.split_by_headings(text, headings)
+        headings = heading_detector.detect_headings(text)
+        sections = heading_detector.split_by_headings(text, headings)
         
         assert len(sections) == 1
         assert sections[0]['title'] == "Document"
         assert sections[0]['section_type'] == "body"
     
-    def test_classify_section_introduction(self):
-        """Test section classification for introduction"""
-        detector = HeadingDetector()
-        
-        assert detector._classify_section("Introduction") == "introduction"
-        assert detector._classify_section("BACKGROUND") == "introduction"
-        assert detector._classify_section("Overview") == "introduction"
-    
-    def test_classify_section_conclusion(self):
-        """Test section classification for conclusion"""
-        detector = HeadingDetector()
-        
-        assert detector._classify_section("Conclusion") == "conclusion"
-        assert detector._classify_section("SUMMARY") == "conclusion"
-        assert detector._classify_section("Final Remarks") == "conclusion"
-    
-    def test_classify_section_methodology(self):
-        """Test section classification for methodology"""
-        detector = HeadingDetector()
-        
-        assert detector._classify_section("Methods") == "methodology"
-        assert detector._classify_section("APPROACH") == "methodology"
-        assert detector._classify_section("Implementation") == "methodology"
-    
-    def test_classify_section_body(self):
-        """Test section classification for body"""
-        detector = HeadingDetector()
-        
-        assert detector._classify_section("Main Content") == "body"
-        assert detector._classify_section("Discussion") == "body"
+    @pytest.mark.parametrize("title,expected", [
+        ("Introduction", "introduction"),
+        ("BACKGROUND", "introduction"),
+        ("Overview", "introduction"),
+        ("Conclusion", "conclusion"),
+        ("SUMMARY", "conclusion"),
+        ("Final Remarks", "conclusion"),
+        ("Methods", "methodology"),
+        ("APPROACH", "methodology"),
+        ("Implementation", "methodology"),
+        ("Main Content", "body"),
+        ("Discussion", "body"),
+    ])
+    def test_classify_section(self, heading_detector, title, expected):
+        """Test section classification by heading keywords"""
+        assert heading_detector._classify_section(title) == expected
@@ -11,6 +11,12 @@ from app.roles.role_templates import (
 )
 
 
+@pytest.fixture(scope="module")
+def library():
+    """Shared RoleTemplateLibrary"""
+    return RoleTemplateLibrary()
+
+
 class TestRoleTemplate:
     """Test suite for RoleTemplate"""
     
@@ -82,10 +88,8 @@ class TestRoleTemplateLibrary:
         assert len(library.get_all_roles()) == 5
         assert len(library.get_role_names()) == 5
     
-    def test_get_role_by_type(self):
+    def test_get_role_by_type(self, library):
         """Test getting role by type"""
-        library = RoleTemplateLibrary()
-        
         explainer = library.get_role(RoleType.EXPLAINER)
         assert explainer.name == "Explainer"
         assert explainer.role_type == RoleType.EXPLAINER
@@ -93,10 +97,8 @@ class TestRoleTemplateLibrary:
         challenger = library.get_role(RoleType.CHALLENGER)
         assert challenger.name == "Challenger"
     
-    def test_get_role_by_name(self):
+    def test_get_role_by_name(self, library):
         """Test getting role by name"""
-        library = RoleTemplateLibrary()
-        
         explainer = library.get_role_by_name("Explainer")
         assert explainer is not None
         assert explainer.name == "Explainer"
@@ -106,17 +108,13 @@ class TestRoleTemplateLibrary:
         assert explainer2 is not None
         assert explainer2.name == "Explainer"
     
-    def test_get_role_by_name_not_found(self):
+    def test_get_role_by_name_not_found(self, library):
         """Test getting non-existent role"""
-        library = RoleTemplateLibrary()
-        
         result = library.get_role_by_name("NonExistent")
         assert result is None
     
-    def test_get_all_roles(self):
+    def test_get_all_roles(self, library):
         """Test getting all roles"""
-        library = RoleTemplateLibrary()
-        
         roles = library.get_all_roles()
         
         assert len(roles) == 5
@@ -127,103 +125,66 @@ class TestRoleTemplateLibrary:
         assert "Example-Generator" in role_names
         assert "Misconception-Spotter" in role_names
     
-    def test_get_role_names(self):
+    def test_get_role_names(self, library):
         """Test getting role names"""
-        library = RoleTemplateLibrary()
-        
         names = library.get_role_names()
         
         assert len(names) == 5
         assert "Explainer" in names
         assert "Challenger" in names
     
-    def test_find_best_role_for_keywords_explainer(self):
-        """Test finding best role based on keywords - Explainer"""
-        library = RoleTemplateLibrary()
-        
-        text = "Can you explain what a neural network is?"
-        role = library.find_best_role_for_keywords(text)
-        
-        assert role is not None
-        assert role.name == "Explainer"
-    
-    def test_find_best_role_for_keywords_challenger(self):
-        """Test finding best role based on keywords - Challenger"""
-        library = RoleTemplateLibrary()
-        
-        text = "What are the limitations of this approach?"
-        role = library.find_best_role_for_keywords(text)
-        
-        assert role is not None
-        assert role.name == "Challenger"
-    
-    def test_find_best_role_for_keywords_summarizer(self):
-        """Test finding best role based on keywords - Summarizer"""
-        library = RoleTemplateLibrary()
-        
-        text = "Can you summarize the key points?"
+    @pytest.mark.parametrize("text,expected", [
+        ("Can you explain what a neural network is?", "Explainer"),
+        ("What are the limitations of this approach?", "Challenger"),
+        ("Can you summarize the key points?", "Summarizer"),
+        ("Give me an example of how this works in practice.", "Example-Generator"),
+        ("What are common misconceptions about neural networks?", "Misconception-Spotter"),
+    ])
+    def test_find_best_role_for_keywords(self, library, text, expected):
+        """Test finding best role based on keywords"""
         role = library.find_best_role_for_keywords(text)
         
         assert role is not None
-        assert role.name == "Summarizer"
+        assert role.name == expected
     
-    def test_find_best_role_for_keywords_example_generator(self):
-        """Test finding best role based on keywords - Example-Generator"""
+    def test_find_best_role_for_keywords_cached(self):
+        """Test keyword routing is memoized case-insensitively"""
         library = RoleTemplateLibrary()
         
-        text = "Give me an example of how this works in practice."
-        role = library.find_best_role_for_keywords(text)
+        first = library.find_best_role_for_keywords("Can you summarize the key points?")
+        second = library.find_best_role_for_keywords("CAN YOU SUMMARIZE THE KEY POINTS?")
         
-        assert role is not None
-        assert role.name == "Example-Generator"
+        assert first is second
+        assert library._best_role_for_lowered.cache_info().hits == 1
     
-    def test_find_best_role_for_keywords_misconception_spotter(self):
-        """Test finding best role based on keywords - Misconception-Spotter"""
-        library = RoleTemplateLibrary()
-        
-        text = "What are common misconceptions about neural networks?"
-        role = library.find_best_role_for_keywords(text)
-        
-        assert role is not None
-        assert role.name == "Misconception-Spotter"
-    
-    def test_find_best_role_no_match(self):
+    def test_find_best_role_no_match(self, library):
         """Test finding role with no keyword matches"""
-        library = RoleTemplateLibrary()
-        
         text = "Hello there, nice day!"
         role = library.find_best_role_for_keywords(text)
         
-        # Should return None or default to lowest score
-        # This is acceptable behavior
-        assert True  # Test passes either way
+        # No role keyword scores above zero
+        assert role is None
     
     def test_global_library_instance(self):
         """Test global role_library instance"""
         assert role_library is not None
         assert len(role_library.get_all_roles()) == 5
     
-    def test_role_metadata(self):
+    def test_role_metadata(self, library):
         """Test role metadata"""
-        library = RoleTemplateLibrary()
-        
         explainer = library.get_role(RoleType.EXPLAINER)
         assert explainer.metadata is not None
         assert "icon" in explainer.metadata
         assert "color" in explainer.metadata
         assert "priority" in explainer.metadata
     
-    def test_all_roles_have_unique_names(self):
+    def test_all_roles_have_unique_names(self, library):
         """Test all roles have unique names"""
-        library = RoleTemplateLibrary()
-        
         names = library.get_role_names()
         assert len(names) == len(set(names))  # All unique
     
-    def test_role_priority_keywords(self):
+    def test_role_priority_keywords(self, library):
         """Test all roles have priority keywords"""
-        library = RoleTemplateLibrary()
-        
         for role in library.get_all_roles():
             assert len(role.priority_keywords) > 0
             assert all(isinstance(kw, str) for kw in role.priority_keywords)
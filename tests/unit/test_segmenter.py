@@ -0,0 +1,142 @@
+"""
+Unit Tests for Semantic Segmenter embedding cache
+"""
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.document import segmenter as segmenter_module
+from app.document.segmenter import SemanticSegmenter
+
+
+PARAGRAPHS = [
+    "Machine learning models learn patterns from data.",
+    "Neural networks contain layers and activation functions.",
+]
+
+
+class StubEncoder:
+    """Deterministic stand-in for SentenceTransformer that records encode calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, paragraphs, batch_size=None, convert_to_numpy=True):
+        self.calls.append(list(paragraphs))
+        return np.array(
+            [[float(len(p)), float(sum(map(ord, p)) % 97)] for p in paragraphs],
+            dtype=np.float32
+        )
+
+
+@pytest.fixture
+def make_segmenter(monkeypatch, tmp_path):
+    """Factory for cache-enabled segmenters backed by a fresh StubEncoder"""
+    monkeypatch.setattr(
+        SemanticSegmenter, "_load_model", staticmethod(lambda model_name: StubEncoder())
+    )
+
+    def _make(model_name='all-MiniLM-L6-v2'):
+        return SemanticSegmenter(model_name=model_name, cache_dir=str(tmp_path))
+
+    return _make
+
+
+class TestEmbeddingCache:
+    """Test suite for the on-disk paragraph embedding cache"""
+
+    def test_cache_miss_writes_file(self, make_segmenter, tmp_path):
+        """Test misses are encoded in one call and written to the cache dir"""
+        segmenter = make_segmenter()
+
+        embeddings = segmenter._encode(PARAGRAPHS)
+
+        assert segmenter.model.calls == [PARAGRAPHS]
+        assert embeddings.shape == (2, 2)
+        for paragraph, vector in zip(PARAGRAPHS, embeddings):
+            path = segmenter._cache_path(paragraph)
+            assert path.parent == tmp_path
+            assert np.array_equal(np.load(path), vector)
+        assert sorted(p.suffix for p in tmp_path.iterdir()) == ['.npy', '.npy']
+
+    def test_cache_hit_skips_encode(self, make_segmenter):
+        """Test cached paragraphs are not sent to the model again"""
+        first = make_segmenter()
+        expected = first._encode(PARAGRAPHS)
+
+        second = make_segmenter()
+        embeddings = second._encode(PARAGRAPHS)
+
+        assert second.model.calls == []
+        assert np.array_equal(embeddings, expected)
+
+    @pytest.mark.parametrize("corrupt", [
+        lambda data: data[:20],        # truncated write
+        lambda data: b"not an npy",    # garbage
+        lambda data: b"",              # empty file
+    ])
+    def test_corrupt_cache_file_is_reencoded(self, make_segmenter, corrupt):
+        """Test an unreadable cache file counts as a miss instead of raising"""
+        expected = make_segmenter()._encode(PARAGRAPHS)
+
+        segmenter = make_segmenter()
+        path = segmenter._cache_path(PARAGRAPHS[0])
+        path.write_bytes(corrupt(path.read_bytes()))
+
+        embeddings = segmenter._encode(PARAGRAPHS)
+
+        assert segmenter.model.calls == [PARAGRAPHS[:1]]
+        assert np.array_equal(embeddings, expected)
+        assert np.array_equal(np.load(path), expected[0])
+
+    def test_cache_key_depends_on_model_name(self, make_segmenter):
+        """Test different models never share a cache entry"""
+        minilm = make_segmenter('all-MiniLM-L6-v2')
+        mpnet = make_segmenter('sentence-transformers/all-mpnet-base-v2')
+
+        assert minilm._cache_path(PARAGRAPHS[0]) != mpnet._cache_path(PARAGRAPHS[0])
+        assert minilm._cache_path(PARAGRAPHS[0]) != minilm._cache_path(PARAGRAPHS[1])
+        assert '/' not in mpnet._cache_path(PARAGRAPHS[0]).name
+
+        minilm._encode(PARAGRAPHS)
+        mpnet._encode(PARAGRAPHS)
+
+        assert mpnet.model.calls == [PARAGRAPHS]
+
+
+
+class TestModelLoading:
+    """Test suite for the shared embedding model loader"""
+
+    def test_concurrent_first_loads_build_one_model(self, monkeypatch):
+        """Test threads racing on the first load share a single model instance"""
+        built = []
+
+        def slow_model(model_name):
+            time.sleep(0.05)
+            built.append(model_name)
+            return StubEncoder()
+
+        monkeypatch.setattr(segmenter_module, "SentenceTransformer", slow_model)
+        segmenter_module._cached_sentence_model.cache_clear()
+        try:
+            results = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        segmenter_module._load_sentence_model("stub-model")
+                    )
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            segmenter_module._cached_sentence_model.cache_clear()
+
+        assert built == ["stub-model"]
+        assert len({id(model) for model in results}) == 1